@@ -14,7 +14,7 @@ from bson import ObjectId
 
 from config import CFG
 from database import UserManager, RequestManager, Cache, files_col
-from tmdb import get_tmdb_details, build_detail_card, search_tmdb
+from tmdb import get_tmdb_details_async, build_detail_card, search_tmdb_async
 from matcher import find_similar_files
 from keyboards import KeyboardBuilder
 from messages import cards, notifications, errors
@@ -120,7 +120,7 @@ class CallbackHandlers:
             await callback_query.answer("🔄 Loading details...", show_alert=False)
             
             # Get media details
-            media_data = get_tmdb_details(media_type, tmdb_id)
+            media_data = await get_tmdb_details_async(media_type, tmdb_id)
             if not media_data:
                 await callback_query.answer("❌ Error fetching details", show_alert=True)
                 return
@@ -218,7 +218,7 @@ class CallbackHandlers:
                 return
             
             # Get media details
-            media_data = get_tmdb_details(media_type, tmdb_id)
+            media_data = await get_tmdb_details_async(media_type, tmdb_id)
             if not media_data:
                 await callback_query.answer("❌ Error fetching details", show_alert=True)
                 return
@@ -350,7 +350,7 @@ class CallbackHandlers:
             
             # Notify user
             try:
-                media_data = get_tmdb_details(media_type, tmdb_id)
+                media_data = await get_tmdb_details_async(media_type, tmdb_id)
                 if media_data:
                     title = media_data.get("title") if media_type == "movie" else media_data.get("name")
                     await self.bot.send_message(
@@ -434,7 +434,7 @@ class CallbackHandlers:
                 return
             
             # Search TMDB with new page
-            results = search_tmdb(query, page)
+            results = await search_tmdb_async(query, page)
             
             if not results:
                 await callback_query.answer("❌ No more results", show_alert=True)
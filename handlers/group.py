@@ -13,7 +13,7 @@ from pyrogram.types import Message, InlineKeyboardMarkup
 
 from config import CFG
 from database import UserManager, StatsManager
-from tmdb import search_tmdb
+from tmdb import search_tmdb_async
 from keyboards import KeyboardBuilder
 from messages import help_msgs, errors
 
@@ -110,8 +110,8 @@ class GroupHandlers:
         )
         
         try:
-            # Search TMDB
-            results = search_tmdb(query)
+            # Search TMDB (off-loop so one slow request can't freeze the bot)
+            results = await search_tmdb_async(query)
             
             if not results:
                 await searching_msg.delete()
@@ -3,15 +3,92 @@ Advanced fuzzy matching algorithms for Sri Lankan movie file names
 """
 
 import re
+import sys
 import math
+import heapq
+import functools
+from os.path import splitext
 from typing import List, Tuple, Dict, Optional, Set, Any
 from difflib import SequenceMatcher
 from dataclasses import dataclass
 from datetime import datetime
 
+# Optional C++ implementation of sequence similarity (20-50x faster);
+# fall back to stdlib difflib when rapidfuzz isn't installed
+try:
+    from rapidfuzz import fuzz as _fuzz
+except ImportError:
+    _fuzz = None
+
+# process.cdist vectorizes batch scoring but needs numpy for its result matrix
+try:
+    import numpy  # noqa: F401
+    from rapidfuzz import process as _process
+except ImportError:
+    _process = None
+
+@functools.lru_cache(maxsize=4096)
+def _trigrams(s: str) -> frozenset:
+    """Character 3-gram set of a normalized string (cached: the TMDB-side
+    string repeats for every file in a batch)"""
+    return frozenset(s[i:i + 3] for i in range(len(s) - 2))
+
+def _score_match(token_coverage: float, sequence_similarity: float, jaccard_similarity: float,
+                 year_state: int, quality_score: float, tmdb_len: int, file_len: int,
+                 num_unique_file_tokens: int) -> Tuple[float, float]:
+    """
+    Scalar scoring arithmetic shared by all match calculations.
+    year_state: 0 = no year info, 1 = exact year match, 2 = year mismatch,
+    3 = TMDB has a year but the file doesn't. quality_score < 0 means the
+    file carried no quality tag. Returns (base_score, confidence).
+    """
+    base_score = (token_coverage * 0.5) + (sequence_similarity * 0.3) + (jaccard_similarity * 0.2)
+
+    # Year matching bonus/penalty
+    if year_state == 1:
+        base_score = min(1.0, base_score * 1.2)  # 20% bonus for exact year match
+    elif year_state == 2:
+        base_score *= 0.3  # Heavy penalty for wrong year
+    elif year_state == 3:
+        base_score *= 0.7  # TMDB has year but file doesn't - moderate penalty
+
+    # Higher quality gets slight bonus
+    if quality_score >= 0.0:
+        base_score = min(1.0, base_score * (0.9 + (quality_score * 0.1)))
+
+    # Length penalty for very short/long matches
+    length_ratio = min(tmdb_len, file_len) / max(tmdb_len, file_len) if max(tmdb_len, file_len) > 0 else 0
+    base_score *= length_ratio
+
+    confidence = base_score
+
+    # Boost confidence if token coverage is high
+    if token_coverage >= 0.8:
+        confidence = min(1.0, confidence * 1.1)
+
+    # Penalize if too many unique file tokens (noise)
+    if num_unique_file_tokens > 5:
+        confidence *= 0.8
+
+    return base_score, confidence
+
+# JIT-compile the arithmetic when numba is installed; the pure-Python
+# version above is the fallback, so numba stays optional
+try:
+    from numba import njit as _njit
+    _score_match = _njit(cache=True)(_score_match)
+except ImportError:
+    pass
+
 @dataclass
 class MatchResult:
     """Result of a file matching operation"""
+    # One instance per scored candidate, so skip the per-instance __dict__
+    # (manual tuple instead of @dataclass(slots=True): the Dockerfile still
+    # targets Python 3.9)
+    __slots__ = ('file_name', 'similarity_score', 'matched_tokens', 'unmatched_tokens',
+                 'year_match', 'quality_match', 'language_match', 'confidence')
+
     file_name: str
     similarity_score: float
     matched_tokens: List[str]
@@ -38,7 +115,8 @@ class AdvancedMovieMatcher:
     """
     
     # Comprehensive list of junk words and patterns
-    JUNK_WORDS = {
+    # (contents interned so repeated probes compare by pointer first)
+    JUNK_WORDS = frozenset(sys.intern(w) for w in {
         # Quality indicators
         "480p", "720p", "1080p", "2160p", "4k", "8k", "hdr", "sdr", "uhd", "fhd", "hd", "sd",
         "10bit", "8bit", "hdr10", "hdr10plus", "dv", "dolbyvision", "bluray", "webrip", "webdl",
@@ -72,15 +150,15 @@ class AdvancedMovieMatcher:
         
         # Website/domain parts
         "www", "com", "net", "org", "lk", "in", "to", "me", "co", "uk", "us", "tv", "website",
-    }
+    })
     
     # Words that should be kept even if short
-    KEEP_WORDS = {
+    KEEP_WORDS = frozenset(sys.intern(w) for w in {
         "ii", "iii", "iv", "v", "vi", "vii", "viii", "ix", "x", "xi", "xii",  # Roman numerals
         "tv", "us", "uk", "eu", "in", "at", "on", "of", "the", "and", "a", "an",  # Common words
         "3d", "2d", "4d",  # 3D/2D
         "dc", "uc",  # Director's Cut, Uncut
-    }
+    })
     
     # Common abbreviations and their expansions
     ABBREVIATIONS = {
@@ -106,7 +184,11 @@ class AdvancedMovieMatcher:
         "iw": "infinity war",
         "eg": "endgame",
     }
-    
+
+    # Expansions pre-split once so the token loop extends without re-splitting
+    ABBREVIATIONS_SPLIT = {sys.intern(k): tuple(sys.intern(t) for t in v.split())
+                           for k, v in ABBREVIATIONS.items()}
+
     # Quality patterns with scores
     QUALITY_PATTERNS = {
         "2160p": 1.0, "4k": 1.0, "uhd": 1.0,
@@ -127,37 +209,62 @@ class AdvancedMovieMatcher:
         "english": "en", "dubbed": "dub", "dual": "dual",
     }
     
+    # The singleton is hammered from every search, so make attribute reads
+    # array-index lookups instead of __dict__ probes
+    __slots__ = ('debug', 'year_pattern', 'quality_pattern', 'language_pattern',
+                 'meta_pattern', 'prefix_patterns', 'prefix_re', 'cleanup_table',
+                 'whitespace_re', 'token_re', 'extensions',
+                 '_norm_cache', '_norm_cache_max')
+
     def __init__(self, debug: bool = False):
         self.debug = debug
-        self.year_pattern = re.compile(r'\b(19\d{2}|20[0-2]\d)\b')
-        self.quality_pattern = re.compile(r'\b(' + '|'.join(self.QUALITY_PATTERNS.keys()) + r')\b', re.IGNORECASE)
-        self.language_pattern = re.compile(r'\b(' + '|'.join(self.LANGUAGE_PATTERNS.keys()) + r')\b', re.IGNORECASE)
-        
-        # Common prefixes to remove
-        self.prefix_patterns = [
-            r'^\[[^\]]+\]\s*',  # [Group]
-            r'^\{[^}]+\}\s*',   # {Group}
-            r'^\([^)]+\)\s*',   # (Group)
-            r'^\d{4}p?\s*',     # Year at start
-            r'^[A-Z0-9]{2,6}\s+',  # Short codes like PSA, A2M
-            r'^@\w+\s*',        # @username
-            r'^cine\w+\s+',     # cinesubz, cinehub
-            r'^royal\w+\s+',    # royalmovies, royalseries
-            r'^mlw\w+\s+',      # mlwbd
-            r'^mkv\w+\s+',      # mkvcinemas
-            r'^mov\w+\s+',      # moviezworld
-        ]
-        
-        # File extensions
-        self.extensions = {'.mkv', '.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm', '.m4v', '.ts'}
-    
-    def normalize_filename(self, filename: str) -> Tuple[str, List[str], Optional[str], Dict[str, Any]]:
+
+        # Compiled pattern state depends only on immutable class constants,
+        # so it lives at module level (below) and is shared by every
+        # instance; the attributes here are plain rebinds for compatibility
+        self.year_pattern = _YEAR_RE
+        self.quality_pattern = _QUALITY_RE
+        self.language_pattern = _LANGUAGE_RE
+        self.meta_pattern = _META_RE
+        self.prefix_patterns = _PREFIX_PATTERNS
+        self.prefix_re = _PREFIX_RE
+        self.cleanup_table = _CLEANUP_TABLE
+        self.whitespace_re = _WS_RE
+        self.token_re = _TOKEN_RE
+        self.extensions = _EXTENSIONS
+
+        # Memoization cache for normalize_filename (filename -> result);
+        # the same TMDB title is normalized once per search instead of once per file
+        self._norm_cache: Dict[Tuple[str, str], Tuple[str, Tuple[str, ...], Optional[str], Dict[str, Any]]] = {}
+        self._norm_cache_max = 8192
+
+    def normalize_filename(self, filename: str, mode: str = 'file') -> Tuple[str, List[str], Optional[str], Dict[str, Any]]:
+        """
+        Advanced normalization of filename (memoized)
+        mode='title' is a fast path for clean TMDB titles that skips the
+        release-tag stages (extension, quality/language, prefix stripping)
+        Returns: (normalized_string, tokens, year, metadata)
+        """
+        key = (mode, filename)
+        cached = self._norm_cache.get(key)
+        if cached is None:
+            if len(self._norm_cache) >= self._norm_cache_max:
+                # Evict oldest entry (dicts preserve insertion order)
+                self._norm_cache.pop(next(iter(self._norm_cache)))
+            cached = self._normalize_uncached(filename, mode)
+            self._norm_cache[key] = cached
+
+        normalized, tokens, year, metadata = cached
+        # Hand out fresh containers so callers can't mutate the cached copy
+        return normalized, list(tokens), year, dict(metadata)
+
+    def _normalize_uncached(self, filename: str, mode: str = 'file') -> Tuple[str, Tuple[str, ...], Optional[str], Dict[str, Any]]:
         """
         Advanced normalization of filename
         Returns: (normalized_string, tokens, year, metadata)
         """
         if not filename:
-            return "", [], None, {}
+            return "", (), None, {}
         
         original = filename
         metadata = {
@@ -171,145 +278,174 @@ class AdvancedMovieMatcher:
         
         # Convert to lowercase
         text = filename.lower().strip()
-        
-        # Remove file extensions
-        for ext in self.extensions:
-            if text.endswith(ext):
-                text = text[:-len(ext)].strip()
-                break
-        
-        # Extract year
+
         year = None
-        year_match = self.year_pattern.search(text)
-        if year_match:
-            year = year_match.group(1)
-            text = self.year_pattern.sub(' ', text)
-            metadata["has_year"] = True
-        
-        # Extract quality
-        quality_match = self.quality_pattern.search(text)
-        if quality_match:
-            quality = quality_match.group(0).lower()
-            text = self.quality_pattern.sub(' ', text)
-            metadata["quality"] = quality
-            metadata["has_quality"] = True
-        
-        # Extract language
-        language_match = self.language_pattern.search(text)
-        if language_match:
-            language = language_match.group(0).lower()
-            text = self.language_pattern.sub(' ', text)
-            metadata["language"] = language
-            metadata["has_language"] = True
+
+        if mode == 'title':
+            # Clean TMDB titles carry no release tags, so only the year
+            # needs extracting; quality/language/junk words that do appear
+            # in a title are still filtered by the token sieve below. The
+            # prefix strip stays so titles and filenames lose the same
+            # leading short words and stay comparable.
+            year_match = self.year_pattern.search(text)
+            if year_match:
+                year = year_match.group(1)
+                metadata["has_year"] = True
+                text = self.year_pattern.sub(' ', text)
+
+            text = self.prefix_re.sub(' ', text)
+            text = self.whitespace_re.sub(' ', text.translate(self.cleanup_table)).strip()
+            return self._finish_normalize(filename, text, year, metadata)
+
+        # Remove file extensions (one C-level scan from the end instead of
+        # an endswith call per known extension)
+        root, ext = splitext(text)
+        if ext in self.extensions:
+            text = root.strip()
+
+        # Extract year, quality and language in a single pass
+
+        def _capture_meta(match):
+            nonlocal year
+            group = match.lastgroup
+            if group == "year":
+                if year is None:
+                    year = match.group("year")
+                    metadata["has_year"] = True
+            elif group == "quality":
+                if metadata["quality"] is None:
+                    metadata["quality"] = match.group("quality").lower()
+                    metadata["has_quality"] = True
+            elif metadata["language"] is None:
+                metadata["language"] = match.group("lang").lower()
+                metadata["has_language"] = True
+            return ' '
+
+        text = self.meta_pattern.sub(_capture_meta, text)
         
         # Remove common prefixes
-        for pattern in self.prefix_patterns:
-            text = re.sub(pattern, ' ', text, flags=re.IGNORECASE)
-        
-        # Replace separators with spaces
-        text = re.sub(r'[\._\-\[\]\(\)\{\}\|]', ' ', text)
-        
-        # Remove special characters but keep letters, numbers, and spaces
-        text = re.sub(r'[^\w\s]', '', text)
-        
-        # Remove multiple spaces
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = self.prefix_re.sub(' ', text)
         
-        # Split into tokens
-        tokens = text.split()
-        
-        # Process tokens
+        # Replace separators with spaces, drop special characters and
+        # collapse multiple spaces
+        text = self.whitespace_re.sub(' ', text.translate(self.cleanup_table)).strip()
+
+        return self._finish_normalize(original, text, year, metadata)
+
+    def _finish_normalize(self, original: str, text: str, year: Optional[str],
+                          metadata: Dict[str, Any]) -> Tuple[str, Tuple[str, ...], Optional[str], Dict[str, Any]]:
+        """Token sieve, dedup and result assembly shared by both modes"""
+        # Classify tokens with the sieve regex: junk is dropped, abbreviations
+        # expand, mixed alphanumerics lose their digits (e.g. "movie123" ->
+        # "movie"), anything else is kept as-is
         filtered_tokens = []
-        for token in tokens:
-            # Skip empty tokens
-            if not token:
-                continue
-            
-            # Check if token should be kept
-            if token in self.KEEP_WORDS:
-                filtered_tokens.append(token)
-                continue
-            
-            # Skip junk words
-            if token in self.JUNK_WORDS:
-                continue
-            
-            # Skip single characters (unless Roman numerals)
-            if len(token) == 1 and token not in 'ivx':
-                continue
-            
-            # Skip pure numbers (except years which we already extracted)
-            if token.isdigit() and len(token) != 4:
-                continue
-            
-            # Expand abbreviations
-            if token in self.ABBREVIATIONS:
-                filtered_tokens.extend(self.ABBREVIATIONS[token].split())
+        for match in self.token_re.finditer(text):
+            group = match.lastgroup
+            if group == "junk":
                 continue
-            
-            # Remove numbers from mixed alphanumeric tokens (e.g., "movie123" -> "movie")
-            if any(c.isdigit() for c in token):
-                token = re.sub(r'\d+', '', token)
-                if not token or len(token) < 2:
-                    continue
-            
-            filtered_tokens.append(token)
-        
-        # Remove duplicate tokens while preserving order
-        seen = set()
-        unique_tokens = []
-        for token in filtered_tokens:
-            if token not in seen:
-                seen.add(token)
-                unique_tokens.append(token)
-        
+            if group == "abbr":
+                filtered_tokens.extend(self.ABBREVIATIONS_SPLIT[match.group()])
+            elif group == "mixed":
+                token = match.group().translate(_DIGIT_STRIP)
+                if len(token) >= 2:
+                    filtered_tokens.append(sys.intern(token))
+            else:
+                # Interned tokens make the dedup and the per-file set
+                # intersections mostly pointer comparisons; the cost is paid
+                # once per unique filename thanks to the memoization cache
+                filtered_tokens.append(sys.intern(match.group()))
+        
+        # Remove duplicate tokens while preserving order (dicts keep
+        # insertion order, and fromkeys dedups in C)
+        unique_tokens = list(dict.fromkeys(filtered_tokens))
+
         normalized = ' '.join(unique_tokens)
         
         if self.debug:
             print(f"[DEBUG] Normalized '{original}' -> '{normalized}'")
             print(f"  Tokens: {unique_tokens}")
             print(f"  Year: {year}, Quality: {metadata['quality']}, Language: {metadata['language']}")
-        
-        return normalized, unique_tokens, year, metadata
+
+        return normalized, tuple(unique_tokens), year, metadata
     
-    def calculate_similarity(self, tmdb_title: str, filename: str, 
+    def calculate_similarity(self, tmdb_title: str, filename: str,
                            tmdb_year: Optional[str] = None) -> MatchResult:
         """
         Calculate similarity between TMDB title and filename
         Returns a comprehensive MatchResult object
         """
         # Normalize TMDB title
-        tmdb_norm, tmdb_tokens, _, _ = self.normalize_filename(tmdb_title)
-        
+        tmdb_norm, tmdb_tokens, _, _ = self.normalize_filename(tmdb_title, mode='title')
+
+        return self._similarity_prenorm(tmdb_norm, tmdb_tokens, set(tmdb_tokens),
+                                        filename, tmdb_year)
+
+    def _similarity_prenorm(self, tmdb_norm: str, tmdb_tokens: List[str], tmdb_set: Set[str],
+                            filename: str, tmdb_year: Optional[str] = None) -> MatchResult:
+        """
+        Similarity scoring against an already-normalized TMDB title,
+        so batch callers normalize the title once instead of per file
+        """
+        return self._build_result(
+            filename, self._score_file(tmdb_norm, tmdb_tokens, tmdb_set, filename, tmdb_year))
+
+    @staticmethod
+    def _build_result(filename: str, scored: tuple) -> MatchResult:
+        """Materialize a MatchResult (and its token lists) from a scored tuple"""
+        base_score, confidence, common_tokens, unique_tmdb_tokens, year_match, quality_match, language_match = scored
+        return MatchResult(
+            file_name=filename,
+            similarity_score=base_score,
+            matched_tokens=list(common_tokens),
+            unmatched_tokens=list(unique_tmdb_tokens),
+            year_match=year_match,
+            quality_match=quality_match,
+            language_match=language_match,
+            confidence=confidence
+        )
+
+    def _score_file(self, tmdb_norm: str, tmdb_tokens: List[str], tmdb_set: Set[str],
+                    filename: str, tmdb_year: Optional[str] = None) -> tuple:
+        """
+        Score one candidate without allocating a MatchResult or token
+        lists, so batch callers can threshold first and materialize only
+        survivors. Returns (base_score, confidence, common_tokens,
+        unique_tmdb_tokens, year_match, quality_match, language_match).
+        """
         # Normalize filename
         file_norm, file_tokens, file_year, file_metadata = self.normalize_filename(filename)
-        
+
         if not tmdb_tokens or not file_tokens:
-            return MatchResult(
-                file_name=filename,
-                similarity_score=0.0,
-                matched_tokens=[],
-                unmatched_tokens=tmdb_tokens,
-                year_match=False,
-                quality_match=None,
-                language_match=None,
-                confidence=0.0
-            )
+            return 0.0, 0.0, (), tmdb_tokens, False, None, None
         
         # Convert to sets for set operations
-        tmdb_set = set(tmdb_tokens)
         file_set = set(file_tokens)
         
         # Calculate token-based metrics
         common_tokens = tmdb_set.intersection(file_set)
         unique_tmdb_tokens = tmdb_set - file_set
         unique_file_tokens = file_set - tmdb_set
-        
+
         # Token coverage (how many TMDB tokens are found in file)
         token_coverage = len(common_tokens) / len(tmdb_set) if tmdb_set else 0.0
-        
-        # Sequence similarity
-        sequence_similarity = SequenceMatcher(None, tmdb_norm, file_norm).ratio()
+
+        # Early exit for obvious misses: with a multi-token title and (almost)
+        # no token overlap the file can never pass the confidence thresholds,
+        # so skip the expensive sequence-similarity stage entirely
+        if len(tmdb_set) > 1 and (not common_tokens or token_coverage < 0.2):
+            return (0.0, 0.0, common_tokens, unique_tmdb_tokens, False,
+                    file_metadata["quality"], file_metadata["language"])
+
+        # Sequence similarity, behind a cheap 3-gram screen: strings long
+        # enough to have trigrams but sharing fewer than two of them cannot
+        # produce a meaningful ratio, so skip the expensive call
+        if (len(tmdb_norm) >= 5 and len(file_norm) >= 5
+                and len(_trigrams(tmdb_norm) & _trigrams(file_norm)) < 2):
+            sequence_similarity = 0.0
+        elif _fuzz is not None:
+            sequence_similarity = _fuzz.ratio(tmdb_norm, file_norm) / 100.0
+        else:
+            sequence_similarity = SequenceMatcher(None, tmdb_norm, file_norm).ratio()
         
         # Jaccard similarity
         if tmdb_set or file_set:
@@ -317,71 +453,40 @@ class AdvancedMovieMatcher:
         else:
             jaccard_similarity = 0.0
         
-        # Weighted similarity score
-        base_score = (token_coverage * 0.5) + (sequence_similarity * 0.3) + (jaccard_similarity * 0.2)
-        
-        # Year matching bonus/penalty
-        year_match = False
+        # Encode year relationship for the scalar scoring helper
         if tmdb_year and file_year:
-            if tmdb_year == file_year:
-                base_score = min(1.0, base_score * 1.2)  # 20% bonus for exact year match
-                year_match = True
-            else:
-                base_score *= 0.3  # Heavy penalty for wrong year
-        
-        elif tmdb_year and not file_year:
-            # TMDB has year but file doesn't - moderate penalty
-            base_score *= 0.7
-        
-        # Quality score adjustment
-        quality_match = None
-        if file_metadata["quality"]:
-            quality_match = file_metadata["quality"]
-            # Higher quality gets slight bonus
-            quality_score = self.QUALITY_PATTERNS.get(quality_match.lower(), 0.5)
-            base_score = min(1.0, base_score * (0.9 + (quality_score * 0.1)))
-        
+            year_state = 1 if tmdb_year == file_year else 2
+        elif tmdb_year:
+            year_state = 3
+        else:
+            year_state = 0
+        year_match = year_state == 1
+
+        # Quality score adjustment (negative means no quality tag on the file)
+        quality_match = file_metadata["quality"]
+        quality_score = self.QUALITY_PATTERNS.get(quality_match.lower(), 0.5) if quality_match else -1.0
+
         # Language detection
         language_match = file_metadata["language"]
-        
-        # Length penalty for very short/long matches
-        tmdb_len = len(tmdb_norm)
-        file_len = len(file_norm)
-        length_ratio = min(tmdb_len, file_len) / max(tmdb_len, file_len) if max(tmdb_len, file_len) > 0 else 0
-        base_score *= length_ratio
-        
-        # Confidence calculation
-        confidence = base_score
-        
-        # Boost confidence if token coverage is high
-        if token_coverage >= 0.8:
-            confidence = min(1.0, confidence * 1.1)
-        
-        # Penalize if too many unique file tokens (noise)
-        if len(unique_file_tokens) > 5:
-            confidence *= 0.8
-        
-        # Create match result
-        result = MatchResult(
-            file_name=filename,
-            similarity_score=base_score,
-            matched_tokens=list(common_tokens),
-            unmatched_tokens=list(unique_tmdb_tokens),
-            year_match=year_match,
-            quality_match=quality_match,
-            language_match=language_match,
-            confidence=confidence
+
+        # Weighted score, year/quality adjustments, length penalty and
+        # confidence boosts all happen in the (optionally JIT-compiled) helper
+        base_score, confidence = _score_match(
+            token_coverage, sequence_similarity, jaccard_similarity,
+            year_state, quality_score, len(tmdb_norm), len(file_norm),
+            len(unique_file_tokens)
         )
-        
+
         if self.debug:
-            print(f"[DEBUG] Similarity for '{tmdb_title}' vs '{filename}':")
+            print(f"[DEBUG] Similarity for '{tmdb_norm}' vs '{filename}':")
             print(f"  Base score: {base_score:.3f}")
             print(f"  Token coverage: {token_coverage:.2f} ({len(common_tokens)}/{len(tmdb_set)})")
             print(f"  Sequence: {sequence_similarity:.3f}, Jaccard: {jaccard_similarity:.3f}")
             print(f"  Year match: {year_match}, Quality: {quality_match}")
             print(f"  Confidence: {confidence:.3f}")
-        
-        return result
+
+        return (base_score, confidence, common_tokens, unique_tmdb_tokens,
+                year_match, quality_match, language_match)
     
     def find_best_matches(self, tmdb_title: str, tmdb_year: Optional[str], 
                          file_names: List[str], limit: int = 5) -> List[MatchResult]:
@@ -389,36 +494,72 @@ class AdvancedMovieMatcher:
         Find best matching files from a list
         """
         matches = []
-        
-        for filename in file_names:
-            result = self.calculate_similarity(tmdb_title, filename, tmdb_year)
-            
-            # Apply thresholds
+
+        # Normalize the TMDB title once for the whole batch
+        tmdb_norm, tmdb_tokens, _, _ = self.normalize_filename(tmdb_title, mode='title')
+        tmdb_set = set(tmdb_tokens)
+
+        # Batch prefilter: score every candidate in one C call and only run
+        # the full Python scoring loop for files that are remotely plausible
+        # (token_set_ratio 30 is far below any passing confidence threshold).
+        # Normalization results are memoized, so the full pass below reuses them.
+        candidate_files = file_names
+        if _process is not None and len(file_names) > 1 and tmdb_norm:
+            file_norms = [self.normalize_filename(f)[0] for f in file_names]
+            scores = _process.cdist([tmdb_norm], file_norms,
+                                    scorer=_fuzz.token_set_ratio, workers=-1)[0]
+            candidate_files = [f for f, s in zip(file_names, scores) if s >= 30.0]
+
+        # Token-coverage prefilter: encode the title vocabulary as bit
+        # positions and popcount the overlap per file, which mirrors the
+        # zero-coverage early exit in scoring without building the three
+        # intermediate sets or a MatchResult for obvious misses
+        vocab = None
+        if len(tmdb_set) > 1:
+            vocab = {tok: 1 << i for i, tok in enumerate(tmdb_set)}
+
+        for filename in candidate_files:
+            if vocab is not None:
+                _, file_tokens, _, _ = self.normalize_filename(filename)
+                file_mask = 0
+                for tok in file_tokens:
+                    file_mask |= vocab.get(tok, 0)
+                # bin().count is the portable popcount (int.bit_count needs 3.10)
+                if bin(file_mask).count('1') / len(vocab) < 0.2:
+                    continue
+
+            scored = self._score_file(tmdb_norm, tmdb_tokens, tmdb_set,
+                                      filename, tmdb_year)
+
+            # Apply thresholds (on the scored tuple; MatchResults and their
+            # token lists are only materialized for dedup survivors below)
             if tmdb_year:
                 # With year - stricter matching
-                if result.confidence >= 0.6:
-                    matches.append(result)
+                if scored[1] >= 0.6:
+                    matches.append((filename, scored))
             else:
                 # Without year - require higher confidence
-                if result.confidence >= 0.75:
-                    matches.append(result)
-        
-        # Sort by confidence (descending)
-        matches.sort(key=lambda x: x.confidence, reverse=True)
-        
+                if scored[1] >= 0.75:
+                    matches.append((filename, scored))
+
+        # Top candidates by confidence: O(N log limit) bounded heap instead
+        # of sorting the whole list; 4x oversample leaves room for the
+        # dedup below to discard entries (nlargest is stable, like sort)
+        candidates = heapq.nlargest(limit * 4, matches, key=lambda m: m[1][1])
+
         # Remove duplicates (same normalized content)
         seen_content = set()
         unique_matches = []
-        
-        for match in matches:
-            norm_content = ' '.join(sorted(match.matched_tokens))
+
+        for filename, scored in candidates:
+            norm_content = ' '.join(sorted(scored[2]))
             if norm_content not in seen_content:
                 seen_content.add(norm_content)
-                unique_matches.append(match)
-                
+                unique_matches.append(self._build_result(filename, scored))
+
                 if len(unique_matches) >= limit:
                     break
-        
+
         return unique_matches
     
     def extract_keywords(self, filename: str) -> Dict[str, Any]:
@@ -437,11 +578,13 @@ class AdvancedMovieMatcher:
             else:
                 other_keywords.append(token)
         
-        # Sort by length (descending)
-        title_keywords.sort(key=len, reverse=True)
-        
+        # Top 5 longest tokens without sorting the whole list
+        # (normalization itself is served from the memoization cache when
+        # the filename was already seen by the matching path)
+        title_keywords = heapq.nlargest(5, title_keywords, key=len)
+
         return {
-            "title_keywords": title_keywords[:5],  # Top 5 longest tokens as potential title
+            "title_keywords": title_keywords,  # Top 5 longest tokens as potential title
             "other_keywords": other_keywords,
             "year": year,
             "quality": metadata["quality"],
@@ -450,6 +593,74 @@ class AdvancedMovieMatcher:
             "is_english": metadata["language"] in [None, "english", "en"],
         }
 
+# ---------------------------------------------------------------------------
+# Shared compiled-pattern state, built once at import from the class
+# constants above so every AdvancedMovieMatcher instance reuses it
+# ---------------------------------------------------------------------------
+
+_YEAR_RE = re.compile(r'\b(19\d{2}|20[0-2]\d)\b')
+_QUALITY_RE = re.compile(r'\b(' + '|'.join(AdvancedMovieMatcher.QUALITY_PATTERNS.keys()) + r')\b', re.IGNORECASE)
+_LANGUAGE_RE = re.compile(r'\b(' + '|'.join(AdvancedMovieMatcher.LANGUAGE_PATTERNS.keys()) + r')\b', re.IGNORECASE)
+
+# Fused year/quality/language pattern so extraction needs a single scan
+# instead of three search+sub passes (alternation order = priority)
+_META_RE = re.compile(
+    r'\b(?P<year>19\d{2}|20[0-2]\d)\b'
+    r'|\b(?P<quality>' + '|'.join(map(re.escape, AdvancedMovieMatcher.QUALITY_PATTERNS)) + r')\b'
+    r'|\b(?P<lang>' + '|'.join(map(re.escape, AdvancedMovieMatcher.LANGUAGE_PATTERNS)) + r')\b',
+    re.IGNORECASE
+)
+
+# Common prefixes to remove
+_PREFIX_PATTERNS = [
+    r'^\[[^\]]+\]\s*',  # [Group]
+    r'^\{[^}]+\}\s*',   # {Group}
+    r'^\([^)]+\)\s*',   # (Group)
+    r'^\d{4}p?\s*',     # Year at start
+    r'^[A-Z0-9]{2,6}\s+',  # Short codes like PSA, A2M
+    r'^@\w+\s*',        # @username
+    r'^cine\w+\s+',     # cinesubz, cinehub
+    r'^royal\w+\s+',    # royalmovies, royalseries
+    r'^mlw\w+\s+',      # mlwbd
+    r'^mkv\w+\s+',      # mkvcinemas
+    r'^mov\w+\s+',      # moviezworld
+]
+
+# All prefixes are ^-anchored, so one combined alternation replaces
+# ten separate re.sub calls per filename
+_PREFIX_RE = re.compile('|'.join(f'(?:{p})' for p in _PREFIX_PATTERNS), re.IGNORECASE)
+
+# Separator chars become spaces, remaining punctuation is dropped;
+# str.translate does both in one C-level scan instead of two re.sub passes
+_CLEANUP_TABLE = str.maketrans(
+    {**{c: ' ' for c in '._-[](){}|'},
+     **{c: None for c in '!"#$%&\'*+,/:;<=>?@\\^`~'}}
+)
+_WS_RE = re.compile(r'\s+')
+
+# Digit removal for mixed alphanumeric tokens ("movie123" -> "movie");
+# translate beats spinning up the regex engine for a 10-char token
+_DIGIT_STRIP = str.maketrans('', '', '0123456789')
+
+# Token sieve: classifies every token of the cleaned text in one C-level
+# scan instead of a Python loop with several set probes per token.
+# Alternation order mirrors the old loop's check order (KEEP_WORDS ahead
+# of JUNK_WORDS since the two sets overlap); the \b anchors mean each
+# alternative can only consume a whole token.
+_TOKEN_RE = re.compile(
+    r'\b(?:'
+    r'(?P<keep>' + '|'.join(sorted(map(re.escape, AdvancedMovieMatcher.KEEP_WORDS), key=len, reverse=True)) + r')'
+    r'|(?P<junk>' + '|'.join(sorted(map(re.escape, AdvancedMovieMatcher.JUNK_WORDS), key=len, reverse=True)) + r')'
+    r'|(?P<abbr>' + '|'.join(sorted(map(re.escape, AdvancedMovieMatcher.ABBREVIATIONS_SPLIT), key=len, reverse=True)) + r')'
+    r'|(?P<word>[a-z]{2,})'
+    r'|(?P<roman>[ivx])'
+    r'|(?P<mixed>\w{2,})'
+    r')\b'
+)
+
+# File extensions
+_EXTENSIONS = frozenset({'.mkv', '.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm', '.m4v', '.ts'})
+
 # Singleton instance
 matcher = AdvancedMovieMatcher()
 
@@ -459,7 +670,7 @@ def normalize_movie_name(name: str) -> Tuple[str, Optional[str]]:
     Quick normalization for movie/TV show names
     Returns: (normalized_name, year)
     """
-    norm, tokens, year, _ = matcher.normalize_filename(name)
+    norm, tokens, year, _ = matcher.normalize_filename(name, mode='title')
     return norm, year
 
 def find_similar_files(tmdb_title: str, tmdb_year: Optional[str], 
@@ -2,23 +2,99 @@
 Rich message templates and formatters for Ultra Pro Max Bot
 """
 
-import html
+import re
+import sys
+import time
+import functools
+import itertools
+import operator
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime, timezone
 from config import CFG
 
+# MarkdownV2 escape table built once at import; str.translate walks the
+# string in C instead of a per-character Python loop
+_MD_ESCAPE = str.maketrans({c: '\\' + c for c in r'_*[]()~`>#+-=|{}.!'})
+
+# Pre-check for escape_html: most TMDB fields (years, IDs, runtimes, names)
+# contain no specials, so one regex scan avoids html.escape's replace passes
+_HTML_RE = re.compile('[&<>"\']')
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Card frame strings built once instead of re-multiplying per render
+_CARD_HEADER = "🎬" + "─" * 38 + "🎬"
+_CARD_SEP = "─" * 40
+
+# Small tag fragments emitted on every card render, pinned in the intern
+# table so repeated concatenation reuses one object per fragment and
+# equality checks can shortcut on identity (literals in this compile unit
+# are interned anyway; this documents the set and survives module reload)
+for _s in ("<b>", "</b>", "<i>", "</i>", "<code>", "</code>",
+           "⭐ <b>Rating</b>", "📋 <b>Basic Information</b>",
+           "👥 <b>Top Cast</b>", "📝 <b>Overview</b>", "🔗 <b>Links</b>",
+           "• <b>", "</b> ", "N/A"):
+    sys.intern(_s)
+del _s
+
+# Video types worth linking as a trailer (frozenset: O(1) membership)
+_TRAILER_TYPES = frozenset({"Trailer", "Teaser"})
+
+# Static fragments of the "request filled" notification, UTF-8-encoded
+# once at import for the bytes fan-out variant below
+_FILLED_PREFIX_B = ("🎉 <b>Good News!</b>\n\n"
+                    "Your requested content is now available!\n\n"
+                    "<b>Title:</b> ").encode("utf-8")
+_FILLED_FILE_B = "\n<b>File:</b> <code>".encode("utf-8")
+_FILLED_SUFFIX_B = ("</code>\n\n"
+                    "👉 Search in the group to get download links.\n"
+                    "👉 Group එකේ search කරලා download links ගන්න.").encode("utf-8")
+
+@functools.lru_cache(maxsize=128)
+def _stars_for(tenths: int) -> str:
+    """Star string for a rating given in tenths (e.g. 85 -> ★★★★☆ variants)"""
+    # Convert 10-point scale to 5-star scale
+    normalized = tenths / 20
+
+    full_stars = int(normalized)
+    half_star = 1 if normalized - full_stars >= 0.5 else 0
+    empty_stars = 5 - full_stars - half_star
+
+    stars = "★" * full_stars
+    if half_star:
+        stars += "½"
+    stars += "☆" * empty_stars
+
+    return stars
+
+@functools.lru_cache(maxsize=1)
+def _minute_stamp(minute_epoch: int) -> str:
+    """Card footer timestamp, formatted once per minute instead of per card"""
+    return datetime.fromtimestamp(minute_epoch * 60).strftime('%Y-%m-%d %H:%M')
+
+@functools.lru_cache(maxsize=2)
+def _utc_second_stamp(epoch_s: int) -> str:
+    """Admin-notification timestamp, formatted once per second so bursty
+    request traffic doesn't pay strftime per notification"""
+    return datetime.fromtimestamp(epoch_s, timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
+
 class MessageFormatter:
     """Formats messages with rich formatting and emojis"""
-    
+
     @staticmethod
     def escape_markdown(text: str) -> str:
         """Escape special characters for MarkdownV2"""
-        escape_chars = r'_*[]()~`>#+-=|{}.!'
-        return ''.join(f'\\{char}' if char in escape_chars else char for char in text)
+        return text.translate(_MD_ESCAPE)
     
     @staticmethod
     def escape_html(text: str) -> str:
         """Escape HTML special characters"""
+        if not _HTML_RE.search(text):
+            return text
+        # Deferred import: only strings that actually contain specials
+        # need it, so cold start skips loading html entirely (after the
+        # first hit this is just a sys.modules lookup)
+        import html
         return html.escape(text)
     
     @staticmethod
@@ -26,16 +102,29 @@ class MessageFormatter:
         """Truncate text with ellipsis"""
         if len(text) <= max_length:
             return text
+        # Fast path for the default suffix: skip the len() call
+        if suffix == "...":
+            return text[:max_length - 3] + suffix
         return text[:max_length - len(suffix)] + suffix
     
     @staticmethod
     def format_file_size(size_bytes: int) -> str:
         """Format file size in human readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.2f} PB"
+        if size_bytes < 1024:
+            return f"{size_bytes:.2f} B"
+        # bit_length picks the unit directly (2^10 per step) and dividing
+        # by an exact power of two replaces the iterated float division
+        i = min((size_bytes.bit_length() - 1) // 10, 5)
+        return f"{size_bytes / (1 << (i * 10)):.2f} {_SIZE_UNITS[i]}"
+
+class _MediaFields:
+    """Card fields handed from the extract pass to the render pass;
+    slotted so the per-card record skips a __dict__ allocation"""
+    __slots__ = ('title', 'original_title', 'tagline', 'year', 'rating_text',
+                 'genres_text', 'status', 'runtime_text', 'date_label',
+                 'release_date', 'companies_text', 'languages_text',
+                 'director_line', 'cast_text', 'overview', 'tmdb_url',
+                 'imdb_url', 'imdb_id', 'trailer_key', 'poster_path')
 
 class CardBuilder:
     """Builds rich IMDb-style detail cards"""
@@ -43,13 +132,41 @@ class CardBuilder:
     @staticmethod
     def build_movie_card(movie_data: Dict, matches: List[Dict] = None) -> Tuple[str, Optional[str]]:
         """Build detailed movie card"""
-        return CardBuilder._build_media_card(movie_data, "movie", matches)
+        # Failure isolation lives at the entry points so the build/render
+        # internals stay exception-free and batchable
+        try:
+            return CardBuilder._build_media_card(movie_data, "movie", matches)
+        except Exception as e:
+            return CardBuilder._error_card(movie_data, e)
     
     @staticmethod
     def build_tv_card(tv_data: Dict, matches: List[Dict] = None) -> Tuple[str, Optional[str]]:
         """Build detailed TV show card"""
-        return CardBuilder._build_media_card(tv_data, "tv", matches)
+        try:
+            return CardBuilder._build_media_card(tv_data, "tv", matches)
+        except Exception as e:
+            return CardBuilder._error_card(tv_data, e)
     
+    @staticmethod
+    def build_media_cards(items: List[Tuple[Dict, str]]) -> List[Tuple[str, Optional[str]]]:
+        """
+        Render several (media_data, media_type) cards in one call.
+        The helpers are bound to frame locals once, so bulk fan-out
+        (e.g. notifying every subscriber of a filled request) pays the
+        global/attribute lookups per batch instead of per card, while
+        each card keeps its own failure isolation.
+        """
+        build = CardBuilder._build_media_card
+        error = CardBuilder._error_card
+        results = []
+        append = results.append
+        for media_data, media_type in items:
+            try:
+                append(build(media_data, media_type))
+            except Exception as e:
+                append(error(media_data, e))
+        return results
+
     @staticmethod
     def _build_media_card(media_data: Dict, media_type: str, matches: List[Dict] = None) -> Tuple[str, Optional[str]]:
         """
@@ -60,258 +177,274 @@ class CardBuilder:
         if not media_data:
             return "❌ No data available", None
         
-        try:
-            # Basic information
-            if media_type == "movie":
-                title = media_data.get("title", "Unknown Movie")
-                original_title = media_data.get("original_title", "")
-                tagline = media_data.get("tagline", "")
-                runtime = media_data.get("runtime", 0)
-                release_date = media_data.get("release_date", "")
-                status = media_data.get("status", "Unknown")
-                
-                # Runtime formatting
-                if runtime:
-                    hours = runtime // 60
-                    minutes = runtime % 60
-                    runtime_text = f"{hours}h {minutes}m" if hours else f"{minutes}m"
-                else:
-                    runtime_text = "N/A"
-                    
-            else:  # TV Show
-                title = media_data.get("name", "Unknown TV Show")
-                original_title = media_data.get("original_name", "")
-                tagline = ""
-                runtime = 0
-                runtime_text = "N/A"
-                release_date = media_data.get("first_air_date", "")
-                status = media_data.get("status", "Unknown")
-                
-                # Seasons and episodes
-                seasons = media_data.get("number_of_seasons", 0)
-                episodes = media_data.get("number_of_episodes", 0)
-                runtime_text = f"{seasons} season{'s' if seasons != 1 else ''} • {episodes} episode{'s' if episodes != 1 else ''}"
-            
-            # Year extraction
-            year = release_date[:4] if release_date else "N/A"
-            
-            # Rating information
-            vote_average = media_data.get("vote_average", 0)
-            vote_count = media_data.get("vote_count", 0)
-            
-            # Format rating with stars
-            rating_stars = CardBuilder._get_rating_stars(vote_average)
-            rating_text = f"**{vote_average:.1f}/10** {rating_stars} ({vote_count:,} votes)" if vote_average > 0 else "No ratings yet"
-            
-            # Genres
-            genres = [g["name"] for g in media_data.get("genres", [])]
-            genres_text = " • ".join(genres) if genres else "N/A"
-            
-            # Overview
-            overview = media_data.get("overview", "No overview available.")
-            if len(overview) > 500:
-                overview = overview[:497] + "..."
-            
-            # Credits
-            credits = media_data.get("credits", {})
-            
-            # Director (for movies) / Creator (for TV)
-            if media_type == "movie":
-                directors = []
-                crew = credits.get("crew", [])
-                for person in crew:
-                    if person.get("job") == "Director":
-                        directors.append(person.get("name", "Unknown"))
-                director_text = ", ".join(directors[:3]) or "N/A"
-            else:
-                creators = media_data.get("created_by", [])
-                creator_names = [c.get("name", "Unknown") for c in creators[:3]]
-                director_text = ", ".join(creator_names) or "N/A"
-            
-            # Top cast (up to 8)
-            cast = credits.get("cast", [])
-            top_cast = []
-            for person in cast[:8]:
-                name = person.get("name", "Unknown")
-                character = person.get("character", "")
-                if character:
-                    top_cast.append(f"**{name}** as _{character}_")
-                else:
-                    top_cast.append(f"**{name}**")
-            cast_text = "\n".join(top_cast) if top_cast else "N/A"
-            
-            # Production companies
-            companies = media_data.get("production_companies", [])
-            company_names = [c.get("name", "") for c in companies[:3] if c.get("name")]
-            companies_text = ", ".join(company_names) if company_names else "N/A"
-            
-            # Spoken languages
-            languages = media_data.get("spoken_languages", [])
-            language_names = [lang.get("english_name", "") for lang in languages[:3] if lang.get("english_name")]
-            languages_text = ", ".join(language_names) if language_names else "N/A"
-            
-            # External IDs
-            external_ids = media_data.get("external_ids", {})
-            imdb_id = external_ids.get("imdb_id")
-            imdb_url = f"https://www.imdb.com/title/{imdb_id}" if imdb_id else None
-            
-            # TMDB link
-            tmdb_id = media_data.get("id", 0)
-            tmdb_url = f"https://www.themoviedb.org/{media_type}/{tmdb_id}"
-            
-            # Poster URL
-            poster_path = media_data.get("poster_path")
-            
-            # Videos (trailers)
-            videos = media_data.get("videos", {}).get("results", [])
-            youtube_trailers = [v for v in videos if v.get("site") == "YouTube" and v.get("type") in ("Trailer", "Teaser")]
-            
-            # Build the card
-            lines = []
-            
-            # Header section
-            lines.append("🎬" + "─" * 38 + "🎬")
-            
-            # Title and year
-            lines.append(f"<b>{title}</b>")
-            if year != "N/A":
-                lines.append(f"<i>{year}</i>")
-            
-            # Original title (if different)
-            if original_title and original_title.lower() != title.lower():
-                lines.append(f"<code>Original: {original_title}</code>")
-            
-            # Tagline (for movies)
-            if tagline:
-                lines.append(f"<i>\"{tagline}\"</i>")
-            
-            lines.append("")  # Empty line
-            
-            # Rating section
-            lines.append("⭐ <b>Rating</b>")
-            lines.append(rating_text)
-            
-            lines.append("")  # Empty line
-            
-            # Basic info block
-            lines.append("📋 <b>Basic Information</b>")
-            lines.append(f"• <b>Genres:</b> {genres_text}")
-            lines.append(f"• <b>Status:</b> {status}")
-            lines.append(f"• <b>Runtime:</b> {runtime_text}")
-            
-            if media_type == "movie":
-                lines.append(f"• <b>Release Date:</b> {release_date}")
+        # Split extraction from rendering: the type-specific extractors
+        # fill a slotted field record, so _render_card is branch-free
+        # per field and works from plain attribute reads
+        if media_type == "movie":
+            fields = CardBuilder._extract_movie_fields(media_data)
+        else:
+            fields = CardBuilder._extract_tv_fields(media_data)
+        CardBuilder._extract_common_fields(fields, media_data, media_type)
+
+        return CardBuilder._render_card(fields, matches), fields.poster_path
+
+    @staticmethod
+    def _error_card(media_data: Dict, exc: Exception) -> Tuple[str, None]:
+        """Fallback card when building a detail card fails"""
+        error_msg = "❌ <b>Error creating detail card</b>\n\n"
+        error_msg += f"Title: {media_data.get('title', media_data.get('name', 'Unknown'))}\n"
+        error_msg += f"Error: {str(exc)[:100]}"
+        return error_msg, None
+
+    @staticmethod
+    def _extract_movie_fields(media_data: Dict) -> "_MediaFields":
+        """Extract the movie-specific card fields"""
+        f = _MediaFields()
+        f.title = media_data.get("title", "Unknown Movie")
+        f.original_title = media_data.get("original_title", "")
+        f.tagline = media_data.get("tagline", "")
+        f.release_date = media_data.get("release_date", "")
+        f.status = media_data.get("status", "Unknown")
+        f.date_label = "Release Date"
+
+        # Runtime formatting
+        runtime = media_data.get("runtime", 0)
+        if runtime:
+            hours = runtime // 60
+            minutes = runtime % 60
+            f.runtime_text = f"{hours}h {minutes}m" if hours else f"{minutes}m"
+        else:
+            f.runtime_text = "N/A"
+
+        # Director: stop scanning the crew list after the first 3 matches
+        # instead of walking every entry and slicing afterwards
+        crew = media_data.get("credits", {}).get("crew", [])
+        directors = itertools.islice(
+            (person.get("name", "Unknown") for person in crew
+             if person.get("job") == "Director"), 3)
+        director_text = MessageFormatter.escape_html(", ".join(directors)) or "N/A"
+        f.director_line = f"🎬 <b>Director:</b> {director_text}"
+
+        return f
+
+    @staticmethod
+    def _extract_tv_fields(media_data: Dict) -> "_MediaFields":
+        """Extract the TV-specific card fields"""
+        f = _MediaFields()
+        f.title = media_data.get("name", "Unknown TV Show")
+        f.original_title = media_data.get("original_name", "")
+        f.tagline = ""
+        f.release_date = media_data.get("first_air_date", "")
+        f.status = media_data.get("status", "Unknown")
+        f.date_label = "First Air Date"
+
+        # Seasons and episodes
+        seasons = media_data.get("number_of_seasons", 0)
+        episodes = media_data.get("number_of_episodes", 0)
+        f.runtime_text = f"{seasons} season{'s' if seasons != 1 else ''} • {episodes} episode{'s' if episodes != 1 else ''}"
+
+        creators = media_data.get("created_by", ())
+        director_text = MessageFormatter.escape_html(", ".join(
+            c.get("name", "Unknown") for c in creators[:3])) or "N/A"
+        f.director_line = f"📺 <b>Creator:</b> {director_text}"
+
+        return f
+
+    @staticmethod
+    def _extract_common_fields(f: "_MediaFields", media_data: Dict, media_type: str) -> None:
+        """Fill the card fields shared by movies and TV shows"""
+        # TMDB-supplied text goes through escape_html before being
+        # embedded in the card markup; template literals, emoji and
+        # URLs built from numeric IDs are known-safe and skip the call
+        _e = MessageFormatter.escape_html
+
+        # Year extraction
+        f.year = f.release_date[:4] if f.release_date else "N/A"
+
+        # Rating information
+        vote_average = media_data.get("vote_average", 0)
+        vote_count = media_data.get("vote_count", 0)
+
+        # Format rating with stars
+        rating_stars = CardBuilder._get_rating_stars(vote_average)
+        f.rating_text = f"**{vote_average:.1f}/10** {rating_stars} ({vote_count:,} votes)" if vote_average > 0 else "No ratings yet"
+
+        # Genres (itemgetter is a C-level extractor and join consumes
+        # the map directly, so no intermediate list is built)
+        f.genres_text = _e(" • ".join(
+            map(operator.itemgetter("name"), media_data.get("genres", ())))) or "N/A"
+
+        # Overview
+        overview = media_data.get("overview", "No overview available.")
+        if len(overview) > 500:
+            overview = overview[:497] + "..."
+        f.overview = overview
+
+        # Top cast (up to 8)
+        cast = media_data.get("credits", {}).get("cast", [])
+        top_cast = []
+        for person in cast[:8]:
+            name = person.get("name", "Unknown")
+            character = person.get("character", "")
+            if character:
+                top_cast.append(f"**{name}** as _{character}_")
             else:
-                lines.append(f"• <b>First Air Date:</b> {release_date}")
-            
-            lines.append(f"• <b>Production:</b> {companies_text}")
-            lines.append(f"• <b>Languages:</b> {languages_text}")
-            
-            lines.append("")  # Empty line
-            
-            # Director/Creator
-            if media_type == "movie":
-                lines.append(f"🎬 <b>Director:</b> {director_text}")
+                top_cast.append(f"**{name}**")
+        f.cast_text = _e("\n".join(top_cast)) if top_cast else "N/A"
+
+        # Production companies
+        companies = media_data.get("production_companies", ())
+        f.companies_text = _e(", ".join(
+            c["name"] for c in companies[:3] if c.get("name"))) or "N/A"
+
+        # Spoken languages
+        languages = media_data.get("spoken_languages", ())
+        f.languages_text = _e(", ".join(
+            lang["english_name"] for lang in languages[:3] if lang.get("english_name"))) or "N/A"
+
+        # External IDs
+        external_ids = media_data.get("external_ids", {})
+        f.imdb_id = external_ids.get("imdb_id")
+        f.imdb_url = f"https://www.imdb.com/title/{f.imdb_id}" if f.imdb_id else None
+
+        # TMDB link
+        tmdb_id = media_data.get("id", 0)
+        f.tmdb_url = f"https://www.themoviedb.org/{media_type}/{tmdb_id}"
+
+        # Poster URL
+        f.poster_path = media_data.get("poster_path")
+
+        # Videos (trailers) - only the first YouTube trailer is shown,
+        # so stop at the first hit instead of filtering the whole list
+        videos = media_data.get("videos", {}).get("results", ())
+        trailer = next((v for v in videos
+                        if v.get("site") == "YouTube" and v.get("type") in _TRAILER_TYPES),
+                       None)
+        f.trailer_key = trailer.get("key") if trailer is not None else None
+
+    @staticmethod
+    def _render_card(f: "_MediaFields", matches: List[Dict] = None) -> str:
+        """Render the card text from an extracted field record"""
+        _e = MessageFormatter.escape_html
+
+        # Pre-render the optional sections ("" or "\n"-prefixed content),
+        # then assemble the card in one f-string instead of ~50
+        # list appends plus a join pass
+        year_line = f"\n<i>{f.year}</i>" if f.year != "N/A" else ""
+
+        # Original title (if different)
+        if f.original_title and f.original_title.lower() != f.title.lower():
+            original_line = f"\n<code>Original: {_e(f.original_title)}</code>"
+        else:
+            original_line = ""
+
+        # Tagline (for movies)
+        tagline_line = f"\n<i>\"{_e(f.tagline)}\"</i>" if f.tagline else ""
+
+        if f.imdb_url:
+            imdb_block = (f"\n• <a href='{f.imdb_url}'>IMDb</a>"
+                          f"\n• <b>IMDb ID:</b> <code>{f.imdb_id}</code>")
+        else:
+            imdb_block = ""
+
+        # YouTube trailer
+        if f.trailer_key is not None:
+            youtube_url = f"https://www.youtube.com/watch?v={f.trailer_key}"
+            trailer_line = f"\n• <a href='{youtube_url}'>🎬 Watch Trailer</a>"
+        else:
+            trailer_line = ""
+
+        # Availability section (if matches provided)
+        if matches is not None:
+            if matches:
+                # Hoist loop invariants: one CFG read and one bound
+                # method instead of per-row global/attribute lookups
+                debug = _DEBUG
+                trunc = MessageFormatter.truncate
+
+                rows = []
+                for i, match in enumerate(matches[:3], 1):
+                    filename = _e(trunc(match.get("file_name", "Unknown"), 40))
+                    quality = match.get("quality", "")
+
+                    line = f"{i}. <code>{filename}</code>"
+                    if quality:
+                        line += f" [{quality.upper()}]"
+                    if debug:
+                        line += f" (score: {match.get('score', 0):.2f})"
+
+                    rows.append(line)
+
+                if len(matches) > 3:
+                    rows.append(f"... and {len(matches) - 3} more")
+
+                rows_text = "\n".join(rows)
+                availability = (f"\n\n✅ <b>Available in Database</b>"
+                                f"\nFound {len(matches)} matching file(s):"
+                                f"\n{rows_text}"
+                                f"\n\n👉 Search in group to get download links\n")
             else:
-                lines.append(f"📺 <b>Creator:</b> {director_text}")
-            
-            lines.append("")  # Empty line
-            
-            # Cast section
-            lines.append("👥 <b>Top Cast</b>")
-            lines.append(cast_text)
-            
-            lines.append("")  # Empty line
-            
-            # Overview section
-            lines.append("📝 <b>Overview</b>")
-            lines.append(overview)
-            
-            lines.append("")  # Empty line
-            
-            # Links section
-            lines.append("🔗 <b>Links</b>")
-            lines.append(f"• <a href='{tmdb_url}'>TMDB</a>")
-            if imdb_url:
-                lines.append(f"• <a href='{imdb_url}'>IMDb</a>")
-                lines.append(f"• <b>IMDb ID:</b> <code>{imdb_id}</code>")
-            
-            # YouTube trailer
-            if youtube_trailers:
-                trailer = youtube_trailers[0]
-                youtube_url = f"https://www.youtube.com/watch?v={trailer.get('key')}"
-                lines.append(f"• <a href='{youtube_url}'>🎬 Watch Trailer</a>")
-            
-            lines.append("")  # Empty line
-            
-            # Availability section (if matches provided)
-            if matches is not None:
-                if matches:
-                    lines.append("✅ <b>Available in Database</b>")
-                    lines.append(f"Found {len(matches)} matching file(s):")
-                    
-                    for i, match in enumerate(matches[:3], 1):
-                        filename = match.get("file_name", "Unknown")
-                        score = match.get("score", 0)
-                        quality = match.get("quality", "")
-                        
-                        # Truncate filename
-                        if len(filename) > 40:
-                            filename = filename[:37] + "..."
-                        
-                        line = f"{i}. <code>{filename}</code>"
-                        if quality:
-                            line += f" [{quality.upper()}]"
-                        if CFG.debug_mode:
-                            line += f" (score: {score:.2f})"
-                        
-                        lines.append(line)
-                    
-                    if len(matches) > 3:
-                        lines.append(f"... and {len(matches) - 3} more")
-                    
-                    lines.append("")
-                    lines.append("👉 Search in group to get download links")
-                else:
-                    lines.append("❌ <b>Not Available</b>")
-                    lines.append("This content is not available in our database.")
-                    lines.append("You can request it using the button below.")
-            
-            lines.append("")  # Empty line
-            
-            # Footer
-            lines.append("─" * 40)
-            lines.append(f"📡 <i>Powered by TMDB • {datetime.now().strftime('%Y-%m-%d %H:%M')}</i>")
-            
-            formatted_text = "\n".join(lines)
-            
-            return formatted_text, poster_path
-            
-        except Exception as e:
-            error_msg = "❌ <b>Error creating detail card</b>\n\n"
-            error_msg += f"Title: {media_data.get('title', media_data.get('name', 'Unknown'))}\n"
-            error_msg += f"Error: {str(e)[:100]}"
-            return error_msg, None
+                availability = ("\n\n❌ <b>Not Available</b>"
+                                "\nThis content is not available in our database."
+                                "\nYou can request it using the button below.\n")
+        else:
+            availability = "\n\n"
+
+        return (
+            f"{_CARD_HEADER}"
+            f"\n<b>{_e(f.title)}</b>{year_line}{original_line}{tagline_line}"
+            f"\n\n⭐ <b>Rating</b>"
+            f"\n{f.rating_text}"
+            f"\n\n📋 <b>Basic Information</b>"
+            f"\n• <b>Genres:</b> {f.genres_text}"
+            f"\n• <b>Status:</b> {_e(f.status)}"
+            f"\n• <b>Runtime:</b> {f.runtime_text}"
+            f"\n• <b>{f.date_label}:</b> {f.release_date}"
+            f"\n• <b>Production:</b> {f.companies_text}"
+            f"\n• <b>Languages:</b> {f.languages_text}"
+            f"\n\n{f.director_line}"
+            f"\n\n👥 <b>Top Cast</b>"
+            f"\n{f.cast_text}"
+            f"\n\n📝 <b>Overview</b>"
+            f"\n{_e(f.overview)}"
+            f"\n\n🔗 <b>Links</b>"
+            f"\n• <a href='{f.tmdb_url}'>TMDB</a>{imdb_block}{trailer_line}"
+            f"{availability}"
+            f"\n{_CARD_SEP}"
+            f"\n📡 <i>Powered by TMDB • {_minute_stamp(int(time.time()) // 60)}</i>"
+        )
     
     @staticmethod
     def _get_rating_stars(rating: float) -> str:
         """Convert rating to star emojis"""
         if rating <= 0:
             return "☆☆☆☆☆"
-        
-        # Convert 10-point scale to 5-star scale
-        normalized = rating / 2
-        
-        full_stars = int(normalized)
-        half_star = 1 if normalized - full_stars >= 0.5 else 0
-        empty_stars = 5 - full_stars - half_star
-        
-        stars = "★" * full_stars
-        if half_star:
-            stars += "½"
-        stars += "☆" * empty_stars
-        
-        return stars
+        # TMDB reports one decimal (0.0-10.0), so there are at most 101
+        # distinct inputs - memoize on the quantized tenths
+        return _stars_for(round(rating * 10))
+
+# Notification templates pre-compiled once; format_map fuses the ~8
+# per-call string concatenations into a single allocation
+_SUBMITTED_TMPL = ("{icon} <b>Request Submitted</b>\n\n"
+                   "<b>Title:</b> {title_year}\n"
+                   "<b>Type:</b> {media_type}\n"
+                   "<b>Status:</b> ⏳ Pending\n\n"
+                   "We'll notify you when this becomes available.\n"
+                   "Requests expire after {expire_days} days.")
+
+_FILLED_TMPL = ("🎉 <b>Good News!</b>\n\n"
+                "Your requested content is now available!\n\n"
+                "<b>Title:</b> {title_year}\n"
+                "<b>File:</b> <code>{filename}</code>\n\n"
+                "👉 Search in the group to get download links.\n"
+                "👉 Group එකේ search කරලා download links ගන්න.")
+
+_ADMIN_TMPL = ("📥 <b>NEW REQUEST</b>\n\n"
+               "<b>User:</b> {user_info}\n"
+               "{icon} <b>Type:</b> {media_type}\n"
+               "<b>Title:</b> {title_year}\n"
+               "<b>TMDB:</b> {tmdb_link}\n"
+               "<b>Time:</b> {stamp}")
 
 class NotificationBuilder:
     """Builds notification messages"""
@@ -319,168 +452,164 @@ class NotificationBuilder:
     @staticmethod
     def request_submitted(user_id: int, media_type: str, title: str, year: Optional[str]) -> str:
         """Build request submitted notification"""
-        icon = "🎬" if media_type == "movie" else "📺"
-        
-        message = f"{icon} <b>Request Submitted</b>\n\n"
-        message += f"<b>Title:</b> {title}"
-        if year:
-            message += f" ({year})"
-        message += f"\n<b>Type:</b> {media_type.capitalize()}\n"
-        message += f"<b>Status:</b> ⏳ Pending\n\n"
-        message += "We'll notify you when this becomes available.\n"
-        message += f"Requests expire after {CFG.request_expire_days} days."
-        
-        return message
+        return _SUBMITTED_TMPL.format_map({
+            "icon": "🎬" if media_type == "movie" else "📺",
+            "title_year": f"{title} ({year})" if year else title,
+            "media_type": media_type.capitalize(),
+            "expire_days": _REQ_EXPIRE,
+        })
     
     @staticmethod
     def request_filled(title: str, year: Optional[str], filename: str) -> str:
         """Build request filled notification"""
-        message = "🎉 <b>Good News!</b>\n\n"
-        message += "Your requested content is now available!\n\n"
-        message += f"<b>Title:</b> {title}"
-        if year:
-            message += f" ({year})"
-        message += f"\n<b>File:</b> <code>{MessageFormatter.truncate(filename, 50)}</code>\n\n"
-        message += "👉 Search in the group to get download links.\n"
-        message += "👉 Group එකේ search කරලා download links ගන්න."
-        
-        return message
+        return _FILLED_TMPL.format_map({
+            "title_year": f"{title} ({year})" if year else title,
+            "filename": MessageFormatter.truncate(filename, 50),
+        })
     
     @staticmethod
-    def admin_new_request(user_info: str, media_type: str, title: str, 
+    def request_filled_bytes(title: str, year: Optional[str], filename: str) -> bytes:
+        """
+        UTF-8-encoded variant of request_filled for transports that accept
+        pre-encoded payloads: the static prefix/suffix are encoded once at
+        import, so fanning the same notification out to many waiting users
+        skips re-encoding the bulk of the message per recipient
+        """
+        title_part = f"{title} ({year})" if year else title
+        return (_FILLED_PREFIX_B + title_part.encode("utf-8")
+                + _FILLED_FILE_B
+                + MessageFormatter.truncate(filename, 50).encode("utf-8")
+                + _FILLED_SUFFIX_B)
+
+    @staticmethod
+    def admin_new_request(user_info: str, media_type: str, title: str,
                          year: Optional[str], tmdb_link: str) -> str:
         """Build admin notification for new request"""
-        icon = "🎬" if media_type == "movie" else "📺"
-        
-        message = f"📥 <b>NEW REQUEST</b>\n\n"
-        message += f"<b>User:</b> {user_info}\n"
-        message += f"{icon} <b>Type:</b> {media_type.upper()}\n"
-        message += f"<b>Title:</b> {title}"
-        if year:
-            message += f" ({year})"
-        message += f"\n<b>TMDB:</b> {tmdb_link}\n"
-        message += f"<b>Time:</b> {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}"
-        
-        return message
+        return _ADMIN_TMPL.format_map({
+            "user_info": user_info,
+            "icon": "🎬" if media_type == "movie" else "📺",
+            "media_type": media_type.upper(),
+            "title_year": f"{title} ({year})" if year else title,
+            "tmdb_link": tmdb_link,
+            "stamp": _utc_second_stamp(int(time.time())),
+        })
+
+# Static help/info messages depend only on CFG values that don't change
+# during a bot run, so they are rendered once at import and served by
+# reference instead of being re-concatenated on every command.
+# refresh_config() (bottom of module) re-renders them if CFG is mutated.
+def _render_welcome() -> str:
+    return (
+    "👋 <b>Welcome to Ultra Pro Max Movie Finder!</b>\n\n"
+    "🎬 <b>Features:</b>\n"
+    "• Search movies/TV shows in group\n"
+    "• Get detailed info in PM\n"
+    "• Check availability in our database\n"
+    "• Request unavailable content\n"
+    "• Get notified when available\n\n"
+    "⚡ <b>How to use:</b>\n"
+    "1. Go to the authorized group\n"
+    "2. Type a movie/series name\n"
+    "3. Select from results\n"
+    "4. View details in PM\n"
+    "5. Request if not available\n\n"
+    "📊 <b>Limits:</b>\n"
+    f"• Max requests: {CFG.max_requests_per_user} per user\n"
+    f"• Request expires in: {CFG.request_expire_days} days\n\n"
+    "🔧 <b>Support:</b>\n"
+    "Contact @admin for help\n\n"
+    "🚀 <b>සිංහලෙන්:</b>\n"
+    "Group එකේ නමක් type කරන්න → Buttons එයි → Select කරන්න → "
+    "PM එකට details එයි → තියෙනවද check කරන්න → නැත්තම් request කරන්න"
+    )
+
+def _render_help() -> str:
+    return (
+    "🆘 <b>Help Guide</b>\n\n"
+    "🎯 <b>How to search:</b>\n"
+    "1. Go to the authorized group\n"
+    "2. Type movie/series name\n"
+    "3. Select from results\n"
+    "4. View details in PM\n\n"
+    "📥 <b>How to request:</b>\n"
+    "1. Search for content\n"
+    "2. If not available, click 'Request' button\n"
+    "3. Wait for notification when available\n\n"
+    "📊 <b>Your stats:</b>\n"
+    f"• Max requests: {CFG.max_requests_per_user}\n"
+    f"• Request expires in: {CFG.request_expire_days} days\n\n"
+    "⚙️ <b>Commands:</b>\n"
+    "/start - Start the bot\n"
+    "/help - This help message\n"
+    "/requests - View your requests\n"
+    "/stats - View bot statistics\n"
+    "/id - Get chat ID (group only)\n\n"
+    "🔧 <b>Need help?</b> Contact @admin"
+    )
+
+_SEARCH_TIPS_MSG = (
+    "🔍 <b>Search Tips</b>\n\n"
+    "💡 <b>For better results:</b>\n"
+    "• Use English titles\n"
+    "• Include year (e.g., Avengers 2012)\n"
+    "• Check spelling\n"
+    "• Try original title\n\n"
+    "🎬 <b>Examples:</b>\n"
+    "• Avengers Endgame\n"
+    "• Game of Thrones\n"
+    "• Harry Potter 2001\n"
+    "• The Dark Knight\n\n"
+    "📱 <b>සිංහලෙන්:</b>\n"
+    "• ඉංග්‍රීසි නම් use කරන්න\n"
+    "• වර්ෂය එකතු කරන්න\n"
+    "• අකුරු පරීක්ෂා කරන්න"
+)
+
+def _render_request_guide() -> str:
+    return (
+    "📥 <b>Request Guide</b>\n\n"
+    "✅ <b>How to request:</b>\n"
+    "1. Search for content\n"
+    "2. If not available, click 'Request' button\n"
+    "3. Wait for notification\n\n"
+    "⚠️ <b>Important:</b>\n"
+    "• Requesting doesn't guarantee fulfillment\n"
+    "• Depends on availability\n"
+    "• Uploader's discretion\n"
+    f"• Max {CFG.max_requests_per_user} pending requests\n\n"
+    "⏰ <b>Request Status:</b>\n"
+    "• ⏳ Pending - Waiting for upload\n"
+    "• ✅ Done - Available now\n"
+    "• ❌ Cancelled - Request cancelled\n"
+    f"• ⏰ Expired - After {CFG.request_expire_days} days\n\n"
+    "📱 <b>සිංහලෙන්:</b>\n"
+    "• Search කරලා නැත්තම් request කරන්න\n"
+    f"• Request {CFG.max_requests_per_user}ක් විතරක් ඉල්ලන්න පුළුවන්\n"
+    "• Upload වුණා නම් notify කරනවා"
+    )
 
 class HelpMessages:
     """Help and information messages"""
-    
+
     @staticmethod
     def get_welcome_message() -> str:
         """Get welcome message for /start"""
-        message = "👋 <b>Welcome to Ultra Pro Max Movie Finder!</b>\n\n"
-        
-        message += "🎬 <b>Features:</b>\n"
-        message += "• Search movies/TV shows in group\n"
-        message += "• Get detailed info in PM\n"
-        message += "• Check availability in our database\n"
-        message += "• Request unavailable content\n"
-        message += "• Get notified when available\n\n"
-        
-        message += "⚡ <b>How to use:</b>\n"
-        message += "1. Go to the authorized group\n"
-        message += "2. Type a movie/series name\n"
-        message += "3. Select from results\n"
-        message += "4. View details in PM\n"
-        message += "5. Request if not available\n\n"
-        
-        message += f"📊 <b>Limits:</b>\n"
-        message += f"• Max requests: {CFG.max_requests_per_user} per user\n"
-        message += f"• Request expires in: {CFG.request_expire_days} days\n\n"
-        
-        message += "🔧 <b>Support:</b>\n"
-        message += "Contact @admin for help\n\n"
-        
-        message += "🚀 <b>සිංහලෙන්:</b>\n"
-        message += "Group එකේ නමක් type කරන්න → Buttons එයි → Select කරන්න → "
-        message += "PM එකට details එයි → තියෙනවද check කරන්න → නැත්තම් request කරන්න"
-        
-        return message
-    
+        return _WELCOME_MSG
+
     @staticmethod
     def get_help_message() -> str:
         """Get help message"""
-        message = "🆘 <b>Help Guide</b>\n\n"
-        
-        message += "🎯 <b>How to search:</b>\n"
-        message += "1. Go to the authorized group\n"
-        message += "2. Type movie/series name\n"
-        message += "3. Select from results\n"
-        message += "4. View details in PM\n\n"
-        
-        message += "📥 <b>How to request:</b>\n"
-        message += "1. Search for content\n"
-        message += "2. If not available, click 'Request' button\n"
-        message += "3. Wait for notification when available\n\n"
-        
-        message += f"📊 <b>Your stats:</b>\n"
-        message += f"• Max requests: {CFG.max_requests_per_user}\n"
-        message += f"• Request expires in: {CFG.request_expire_days} days\n\n"
-        
-        message += "⚙️ <b>Commands:</b>\n"
-        message += "/start - Start the bot\n"
-        message += "/help - This help message\n"
-        message += "/requests - View your requests\n"
-        message += "/stats - View bot statistics\n"
-        message += "/id - Get chat ID (group only)\n\n"
-        
-        message += "🔧 <b>Need help?</b> Contact @admin"
-        
-        return message
-    
+        return _HELP_MSG
+
     @staticmethod
     def get_search_tips() -> str:
         """Get search tips"""
-        message = "🔍 <b>Search Tips</b>\n\n"
-        
-        message += "💡 <b>For better results:</b>\n"
-        message += "• Use English titles\n"
-        message += "• Include year (e.g., Avengers 2012)\n"
-        message += "• Check spelling\n"
-        message += "• Try original title\n\n"
-        
-        message += "🎬 <b>Examples:</b>\n"
-        message += "• Avengers Endgame\n"
-        message += "• Game of Thrones\n"
-        message += "• Harry Potter 2001\n"
-        message += "• The Dark Knight\n\n"
-        
-        message += "📱 <b>සිංහලෙන්:</b>\n"
-        message += "• ඉංග්‍රීසි නම් use කරන්න\n"
-        message += "• වර්ෂය එකතු කරන්න\n"
-        message += "• අකුරු පරීක්ෂා කරන්න"
-        
-        return message
-    
+        return _SEARCH_TIPS_MSG
+
     @staticmethod
     def get_request_guide() -> str:
         """Get request guide"""
-        message = "📥 <b>Request Guide</b>\n\n"
-        
-        message += "✅ <b>How to request:</b>\n"
-        message += "1. Search for content\n"
-        message += "2. If not available, click 'Request' button\n"
-        message += "3. Wait for notification\n\n"
-        
-        message += "⚠️ <b>Important:</b>\n"
-        message += "• Requesting doesn't guarantee fulfillment\n"
-        message += "• Depends on availability\n"
-        message += "• Uploader's discretion\n"
-        message += f"• Max {CFG.max_requests_per_user} pending requests\n\n"
-        
-        message += "⏰ <b>Request Status:</b>\n"
-        message += "• ⏳ Pending - Waiting for upload\n"
-        message += "• ✅ Done - Available now\n"
-        message += "• ❌ Cancelled - Request cancelled\n"
-        message += f"• ⏰ Expired - After {CFG.request_expire_days} days\n\n"
-        
-        message += "📱 <b>සිංහලෙන්:</b>\n"
-        message += "• Search කරලා නැත්තම් request කරන්න\n"
-        message += f"• Request {CFG.max_requests_per_user}ක් විතරක් ඉල්ලන්න පුළුවන්\n"
-        message += "• Upload වුණා නම් notify කරනවා"
-        
-        return message
+        return _REQUEST_GUIDE_MSG
 
 class StatsMessages:
     """Statistics messages"""
@@ -504,8 +633,8 @@ class StatsMessages:
         message += f"• Messages Sent: {user_data.get('messages_count', 0)}\n\n"
         
         message += f"⚙️ <b>Limits:</b>\n"
-        message += f"• Max Requests: {CFG.max_requests_per_user}\n"
-        message += f"• Used: {request_count}/{CFG.max_requests_per_user}\n"
+        message += f"• Max Requests: {_MAX_REQ}\n"
+        message += f"• Used: {request_count}/{_MAX_REQ}\n"
         
         return message
     
@@ -536,49 +665,74 @@ class StatsMessages:
         
         return message
 
+# Fixed error messages rendered once at import; only the "general"
+# fallback needs per-call formatting (it embeds the error details)
+_ERROR_MESSAGES = {
+    "no_pm": "❌ <b>Cannot send to PM</b>\n\n"
+            "Please start the bot in PM first:\n"
+            "1. Click the button below\n"
+            "2. Press 'Start'\n"
+            "3. Try again",
+
+    "request_limit": f"❌ <b>Request Limit Reached</b>\n\n"
+                   f"You have reached the maximum of {CFG.max_requests_per_user} pending requests.\n"
+                   "Please cancel some requests before making new ones.",
+
+    "maintenance": "🔧 <b>Bot Under Maintenance</b>\n\n"
+                  "The bot is currently undergoing maintenance.\n"
+                  "Please try again later.\n\n"
+                  "Estimated time: 30 minutes",
+
+    "database": "💾 <b>Database Error</b>\n\n"
+               "There was an error accessing the database.\n"
+               "Please try again in a few minutes.",
+
+    "tmdb": "🎬 <b>TMDB Error</b>\n\n"
+           "There was an error fetching data from TMDB.\n"
+           "Please try again later.",
+
+    "not_found": "🔍 <b>Not Found</b>\n\n"
+                "No results found for your search.\n"
+                "Try:\n"
+                "• Different spelling\n"
+                "• English title\n"
+                "• Year (e.g., Avengers 2012)",
+}
+
 class ErrorMessages:
     """Error messages"""
-    
+
     @staticmethod
     def get_error_message(error_type: str, details: str = "") -> str:
         """Get error message based on type"""
-        messages = {
-            "no_pm": "❌ <b>Cannot send to PM</b>\n\n"
-                    "Please start the bot in PM first:\n"
-                    "1. Click the button below\n"
-                    "2. Press 'Start'\n"
-                    "3. Try again",
-            
-            "request_limit": f"❌ <b>Request Limit Reached</b>\n\n"
-                           f"You have reached the maximum of {CFG.max_requests_per_user} pending requests.\n"
-                           "Please cancel some requests before making new ones.",
-            
-            "maintenance": "🔧 <b>Bot Under Maintenance</b>\n\n"
-                          "The bot is currently undergoing maintenance.\n"
-                          "Please try again later.\n\n"
-                          "Estimated time: 30 minutes",
-            
-            "database": "💾 <b>Database Error</b>\n\n"
-                       "There was an error accessing the database.\n"
-                       "Please try again in a few minutes.",
-            
-            "tmdb": "🎬 <b>TMDB Error</b>\n\n"
-                   "There was an error fetching data from TMDB.\n"
-                   "Please try again later.",
-            
-            "not_found": "🔍 <b>Not Found</b>\n\n"
-                        "No results found for your search.\n"
-                        "Try:\n"
-                        "• Different spelling\n"
-                        "• English title\n"
-                        "• Year (e.g., Avengers 2012)",
-            
-            "general": "⚠️ <b>An Error Occurred</b>\n\n"
-                      "Please try again later.\n"
-                      f"Error details: {details[:100]}"
-        }
-        
-        return messages.get(error_type, messages["general"])
+        message = _ERROR_MESSAGES.get(error_type)
+        if message is not None:
+            return message
+        return ("⚠️ <b>An Error Occurred</b>\n\n"
+                "Please try again later.\n"
+                f"Error details: {details[:100]}")
+
+def refresh_config() -> None:
+    """
+    Re-read CFG and re-render the pre-built messages that embed config
+    values. Called once at import; call again if CFG changes at runtime.
+    """
+    global _MAX_REQ, _REQ_EXPIRE, _DEBUG
+    global _WELCOME_MSG, _HELP_MSG, _REQUEST_GUIDE_MSG
+
+    _MAX_REQ = CFG.max_requests_per_user
+    _REQ_EXPIRE = CFG.request_expire_days
+    _DEBUG = CFG.debug_mode
+
+    _WELCOME_MSG = _render_welcome()
+    _HELP_MSG = _render_help()
+    _REQUEST_GUIDE_MSG = _render_request_guide()
+    _ERROR_MESSAGES["request_limit"] = (
+        f"❌ <b>Request Limit Reached</b>\n\n"
+        f"You have reached the maximum of {CFG.max_requests_per_user} pending requests.\n"
+        "Please cancel some requests before making new ones.")
+
+refresh_config()
 
 # Singleton instances for easy access
 formatter = MessageFormatter()
@@ -591,6 +745,7 @@ errors = ErrorMessages()
 # Export
 __all__ = [
     'formatter', 'cards', 'notifications', 'help_msgs', 'stats_msgs', 'errors',
+    'refresh_config',
     'MessageFormatter', 'CardBuilder', 'NotificationBuilder', 
     'HelpMessages', 'StatsMessages', 'ErrorMessages'
 ]
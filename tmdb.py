@@ -4,18 +4,91 @@ TMDB API client with caching and rich detail card generation
 
 import re
 import time
+import asyncio
+import operator
+import functools
+import threading
+import hashlib
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timezone, timedelta
 from typing import Optional, Dict, List, Tuple, Any
-from urllib.parse import quote
+from collections import OrderedDict
 
 from config import CFG
 from database import Cache
 
+# Optional C parser, 3-10x faster than stdlib json on the large
+# append_to_response payloads; fall back to requests' built-in decoding
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# Media types the bot handles; frozenset membership avoids rebuilding a
+# tuple on every check in the hot search/trending paths
+_MEDIA_TYPES = frozenset({"movie", "tv"})
+_TRENDING_MEDIA = frozenset({"all", "movie", "tv"})
+_TIME_WINDOWS = frozenset({"day", "week"})
+
+# Star renderings for ratings 0..10; the display only depends on the
+# integer part (full stars = n // 2, half star when n is odd), so one
+# table entry per point replaces arithmetic and string multiplication
+_STARS = tuple(
+    "★" * (n // 2) + "½" * (n & 1) + "☆" * (5 - n // 2 - (n & 1))
+    for n in range(11)
+)
+
+@functools.lru_cache(maxsize=4096)
+def _build_img_url(base_url: str, size: str, path: str) -> str:
+    """Join base/size/path into an image URL, memoized per tuple"""
+    return f"{base_url}{size}{path}"
+
+# Rich card layout, assembled in one pass via str.format_map instead of
+# dozens of list appends. Optional pieces ({original_line}, {imdb_block},
+# {extras_block}, ...) are pre-rendered to "" or a "\n"-prefixed fragment
+# so the surrounding blank-line structure stays fixed.
+_RICH_CARD_TMPL = (
+    "🎬 **{title}** ({year}){original_line}{tagline_line}\n"
+    "\n"
+    "⭐ **Rating:** {rating_text}\n"
+    "{rating_stars}\n"
+    "\n"
+    "📋 **Basic Information**\n"
+    "• **Genres:** {genres_text}\n"
+    "• **Status:** {status}\n"
+    "{runtime_line}\n"
+    "{date_line}\n"
+    "• **Production:** {companies_text}\n"
+    "• **Languages:** {languages_text}\n"
+    "\n"
+    "{director_line}\n"
+    "\n"
+    "👥 **Top Cast:**\n"
+    "{cast_text}\n"
+    "\n"
+    "📝 **Overview:**\n"
+    "{overview}\n"
+    "\n"
+    "🔗 **Links:**\n"
+    "• **TMDB:** {tmdb_url}{imdb_block}{trailer_line}\n"
+    "\n"
+    "📊 **Additional Info**{extras_block}\n"
+    "\n"
+    "────────────────────────────────────────\n"
+    "💡 *Tip: Use the buttons below to request or search again*"
+)
+
 class TMDBClient:
     """Advanced TMDB API client with intelligent caching and rate limiting"""
-    
+
+    __slots__ = (
+        'api_key', 'session', 'tokens', 'last_refill', 'lock',
+        '_config', '_config_loaded', '_genres_cache', '_mem_cache',
+        '_mem_lock', '_image_base_url',
+    )
+
     BASE_URL = "https://api.themoviedb.org/3"
     IMAGE_BASE_URL = "https://image.tmdb.org/t/p"
     
@@ -28,6 +101,9 @@ class TMDBClient:
     RATE_LIMIT_REQUESTS = 40  # TMDB allows 40 requests per 10 seconds
     RATE_LIMIT_WINDOW = 10
     
+    # Process-local cache size (entries)
+    MEM_CACHE_SIZE = 512
+    
     def __init__(self):
         self.api_key = CFG.tmdb_api_key
         self.session = requests.Session()
@@ -36,66 +112,113 @@ class TMDBClient:
             "Accept": "application/json",
             "Accept-Encoding": "gzip, deflate"
         })
-        
-        # Rate limiting state
-        self.requests_made = 0
-        self.window_start = time.time()
-        self.lock = time.time()
-        
-        # Configuration cache
-        self._config = None
+        # Pool sized for threaded/async fan-out (the default adapter
+        # keeps only 10 sockets); retries with backoff happen inside
+        # urllib3, which also honours Retry-After on 429s
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=40,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET"],
+            ),
+        ))
+        
+        # Rate limiting state: a token bucket refilled continuously from
+        # the monotonic clock (immune to NTP jumps), guarded by a real
+        # lock since the async wrappers call in from executor threads
+        self.tokens = float(self.RATE_LIMIT_REQUESTS)
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+        
+        # Configuration cache: start with the fallback so image URLs
+        # work immediately, then refresh from the API off-thread — the
+        # client is built at import time and must not block startup on
+        # a network round trip
+        self._config = {
+            "images": {
+                "secure_base_url": "https://image.tmdb.org/t/p/",
+                "backdrop_sizes": ["w300", "w780", "w1280", "original"],
+                "poster_sizes": ["w92", "w154", "w185", "w342", "w500", "w780", "original"]
+            }
+        }
         self._config_loaded = False
+        self._image_base_url = self._config["images"]["secure_base_url"]
         self._genres_cache = {}
-        
-        # Load configuration on init
-        self._load_configuration()
+
+        # Process-local LRU in front of the external Cache: repeated
+        # lookups of popular titles hit a dict (~100ns) instead of a
+        # database round trip; entries carry the same TTL as the backend.
+        # Guarded by its own lock since the async wrappers hit it from
+        # multiple executor threads at once
+        self._mem_cache = OrderedDict()
+        self._mem_lock = threading.Lock()
+
+        # Load configuration in the background
+        threading.Thread(target=self._load_configuration, daemon=True).start()
     
     def _rate_limit(self):
-        """Implement rate limiting for TMDB API"""
-        current_time = time.time()
-        
-        # Reset window if expired
-        if current_time - self.window_start > self.RATE_LIMIT_WINDOW:
-            self.requests_made = 0
-            self.window_start = current_time
-        
-        # Check if we've exceeded the limit
-        if self.requests_made >= self.RATE_LIMIT_REQUESTS:
-            wait_time = self.RATE_LIMIT_WINDOW - (current_time - self.window_start)
-            if wait_time > 0:
-                time.sleep(wait_time + 0.5)  # Small buffer
-                self.requests_made = 0
-                self.window_start = time.time()
+        """
+        Token-bucket rate limiting for TMDB API: tokens regenerate at
+        40/10s continuously, so a burst waits only until the next token
+        (max ~0.25s) instead of stalling for a whole window boundary
+        """
+        refill_rate = self.RATE_LIMIT_REQUESTS / self.RATE_LIMIT_WINDOW
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(float(self.RATE_LIMIT_REQUESTS),
+                                  self.tokens + (now - self.last_refill) * refill_rate)
+                self.last_refill = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                wait_time = (1.0 - self.tokens) / refill_rate
+            time.sleep(wait_time)
     
-    def _make_request(self, endpoint: str, params: Optional[Dict] = None, 
-                     retries: int = 3) -> Optional[Dict]:
-        """Make a request to TMDB API with rate limiting and retries"""
+    def _mem_get(self, key: str) -> Optional[Any]:
+        """Look up a key in the in-process LRU (None on miss/expiry)"""
+        with self._mem_lock:
+            entry = self._mem_cache.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                self._mem_cache.pop(key, None)
+                return None
+            self._mem_cache.move_to_end(key)
+            return value
+
+    def _mem_set(self, key: str, value: Any, ttl: int):
+        """Store a key in the in-process LRU, evicting the oldest entry"""
+        with self._mem_lock:
+            cache = self._mem_cache
+            cache[key] = (time.monotonic() + ttl, value)
+            cache.move_to_end(key)
+            if len(cache) > self.MEM_CACHE_SIZE:
+                cache.popitem(last=False)
+
+    def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Dict]:
+        """Make a request to TMDB API with rate limiting
+
+        Retries with backoff are handled by the urllib3 Retry mounted on
+        the session adapter, which also respects Retry-After on 429s.
+        """
         self._rate_limit()
-        
+
         url = f"{self.BASE_URL}{endpoint}"
         params = params or {}
         params["api_key"] = self.api_key
         params.setdefault("language", "en-US")
-        
-        for attempt in range(retries):
-            try:
-                response = self.session.get(url, params=params, timeout=15)
-                response.raise_for_status()
-                
-                self.requests_made += 1
-                return response.json()
-                
-            except requests.exceptions.Timeout:
-                if attempt == retries - 1:
-                    raise
-                time.sleep(2 ** attempt)  # Exponential backoff
-                
-            except requests.exceptions.RequestException as e:
-                if attempt == retries - 1:
-                    raise
-                time.sleep(2 ** attempt)
-        
-        return None
+
+        response = self.session.get(url, params=params, timeout=15)
+        response.raise_for_status()
+
+        if _orjson is not None:
+            return _orjson.loads(response.content)
+        return response.json()
     
     def _load_configuration(self):
         """Load TMDB configuration (base URLs, image sizes, etc.)"""
@@ -105,24 +228,19 @@ class TMDBClient:
         if cached is not None:
             self._config = cached
             self._config_loaded = True
+            self._image_base_url = cached["images"]["secure_base_url"]
             return
-        
+
         try:
             data = self._make_request("/configuration")
             if data:
                 self._config = data
                 self._config_loaded = True
+                self._image_base_url = data["images"]["secure_base_url"]
                 # Cache for 24 hours
                 Cache.set(cache_key, data, ttl=86400)
         except Exception:
-            # Use fallback configuration
-            self._config = {
-                "images": {
-                    "secure_base_url": "https://image.tmdb.org/t/p/",
-                    "backdrop_sizes": ["w300", "w780", "w1280", "original"],
-                    "poster_sizes": ["w92", "w154", "w185", "w342", "w500", "w780", "original"]
-                }
-            }
+            # Keep the fallback configuration seeded in __init__
             self._config_loaded = False
     
     def search_multi(self, query: str, page: int = 1) -> List[Dict]:
@@ -138,11 +256,19 @@ class TMDBClient:
         """
         if not query or len(query.strip()) < 2:
             return []
-        
-        cache_key = f"{self.CACHE_PREFIX_SEARCH}{quote(query.lower())}:{page}"
+
+        # Fixed-width digest keys: percent-encoded queries grow with
+        # input length and bloat the cache keyspace
+        query_digest = hashlib.blake2b(query.lower().encode(), digest_size=12).hexdigest()
+        cache_key = f"{self.CACHE_PREFIX_SEARCH}{query_digest}:{page}"
+
+        cached = self._mem_get(cache_key)
+        if cached is not None:
+            return cached
+
         cached = Cache.get(cache_key)
-        
         if cached is not None:
+            self._mem_set(cache_key, cached, ttl=3600)
             return cached
         
         try:
@@ -157,34 +283,34 @@ class TMDBClient:
             
             # Filter only movies and TV shows
             results = []
+            query_lower = query.lower()
             for item in data.get("results", []):
                 media_type = item.get("media_type")
-                if media_type in ("movie", "tv"):
+                if media_type in _MEDIA_TYPES:
                     # Add some calculated fields
-                    item["_score"] = self._calculate_relevance_score(item, query)
+                    item["_score"] = self._calculate_relevance_score(item, query_lower)
                     results.append(item)
             
-            # Sort by relevance score (if we calculated it)
-            if all("_score" in r for r in results):
-                results.sort(key=lambda x: x["_score"], reverse=True)
+            # Sort by relevance score (every item just got one)
+            results.sort(key=operator.itemgetter("_score"), reverse=True)
             
             # Cache for 1 hour
             Cache.set(cache_key, results, ttl=3600)
+            self._mem_set(cache_key, results, ttl=3600)
             return results
             
         except Exception:
             return []
     
-    def _calculate_relevance_score(self, item: Dict, query: str) -> float:
-        """Calculate relevance score for search results"""
+    def _calculate_relevance_score(self, item: Dict, query_lower: str) -> float:
+        """Calculate relevance score for search results (query pre-lowercased)"""
         score = 0.0
-        
+
         # Get title/name
         title = item.get("title") or item.get("name") or ""
         original_title = item.get("original_title") or item.get("original_name") or ""
-        
+
         # Check exact matches
-        query_lower = query.lower()
         title_lower = title.lower()
         original_lower = original_title.lower()
         
@@ -210,57 +336,61 @@ class TMDBClient:
         elif vote_count > 100:
             score += 5
         
-        # Release date recency boost
+        # Release date recency boost; pre-validate the year slice instead
+        # of paying for an exception on every malformed date
         date_str = item.get("release_date") or item.get("first_air_date") or ""
-        if date_str:
-            try:
-                release_year = int(date_str[:4])
-                current_year = datetime.now().year
-                if release_year >= current_year - 1:  # Recent releases
-                    score += 15
-                elif release_year >= current_year - 5:  # Fairly recent
-                    score += 5
-            except:
-                pass
+        if len(date_str) >= 4 and date_str[:4].isdigit():
+            release_year = int(date_str[:4])
+            current_year = datetime.now().year
+            if release_year >= current_year - 1:  # Recent releases
+                score += 15
+            elif release_year >= current_year - 5:  # Fairly recent
+                score += 5
         
         return score
     
-    def get_details(self, media_type: str, tmdb_id: int) -> Optional[Dict]:
+    def get_details(self, media_type: str, tmdb_id: int,
+                    include_similar: bool = False) -> Optional[Dict]:
         """
         Get detailed information for a movie or TV show
-        
+
         Args:
             media_type: 'movie' or 'tv'
             tmdb_id: TMDB ID
-            
+            include_similar: also append the similar-titles list
+
         Returns:
             Detailed information dictionary or None
         """
-        if media_type not in ("movie", "tv"):
+        if media_type not in _MEDIA_TYPES:
             return None
-        
+
         cache_key = f"{self.CACHE_PREFIX_DETAILS}{media_type}:{tmdb_id}"
+        if include_similar:
+            cache_key += ":full"
+
+        cached = self._mem_get(cache_key)
+        if cached is not None:
+            return cached
+
         cached = Cache.get(cache_key)
-        
         if cached is not None:
+            self._mem_set(cache_key, cached, ttl=21600)
             return cached
-        
+
         try:
-            # Append all relevant details
+            # Only the appends build_rich_card actually reads; similar
+            # has its own endpoint/cache via get_similar()
             append_to_response = [
                 "credits",           # Cast and crew
                 "external_ids",      # IMDb, Facebook, Instagram, etc.
-                "images",           # Posters, backdrops
                 "videos",           # Trailers, teasers
                 "content_ratings",  # Age ratings
-                "release_dates",    # Release dates by country (movies)
-                "similar",          # Similar movies/shows
-                "recommendations"   # Recommendations
             ]
-            
-            if media_type == "tv":
-                append_to_response.extend(["keywords", "episode_groups"])
-            
+
+            if include_similar:
+                append_to_response.append("similar")
+
             data = self._make_request(f"/{media_type}/{tmdb_id}", {
                 "append_to_response": ",".join(append_to_response)
             })
@@ -268,6 +398,7 @@ class TMDBClient:
             if data:
                 # Cache for 6 hours
                 Cache.set(cache_key, data, ttl=21600)
+                self._mem_set(cache_key, data, ttl=21600)
                 return data
             
         except Exception:
@@ -288,13 +419,8 @@ class TMDBClient:
         """
         if not poster_path:
             return None
-        
-        if self._config_loaded and self._config:
-            base_url = self._config["images"]["secure_base_url"]
-        else:
-            base_url = "https://image.tmdb.org/t/p/"
-        
-        return f"{base_url}{size}{poster_path}"
+
+        return _build_img_url(self._image_base_url, size, poster_path)
     
     def get_backdrop_url(self, backdrop_path: Optional[str], size: str = "w1280") -> Optional[str]:
         """
@@ -309,13 +435,8 @@ class TMDBClient:
         """
         if not backdrop_path:
             return None
-        
-        if self._config_loaded and self._config:
-            base_url = self._config["images"]["secure_base_url"]
-        else:
-            base_url = "https://image.tmdb.org/t/p/"
-        
-        return f"{base_url}{size}{backdrop_path}"
+
+        return _build_img_url(self._image_base_url, size, backdrop_path)
     
     def build_rich_card(self, media_data: Dict, media_type: str) -> Tuple[str, Optional[str], Optional[str]]:
         """
@@ -442,110 +563,82 @@ class TMDBClient:
             videos = media_data.get("videos", {}).get("results", [])
             youtube_trailers = [v for v in videos if v.get("site") == "YouTube" and v.get("type") in ("Trailer", "Teaser")]
             
-            # Build the rich card
-            lines = []
-            
-            # Header with title and year
-            lines.append(f"🎬 **{title}** ({year})")
-            
-            # Original title (if different)
+            # Pre-render the optional fragments, then fill the module-level
+            # template in a single pass
             if original_title and original_title.lower() != title.lower():
-                lines.append(f"🎭 *Original Title:* {original_title}")
-            
-            # Tagline (for movies)
-            if tagline:
-                lines.append(f"💫 *\"{tagline}\"*")
-            
-            lines.append("")  # Empty line
-            
-            # Rating and votes
-            lines.append(f"⭐ **Rating:** {rating_text}")
-            lines.append(f"{rating_stars}")
-            
-            lines.append("")  # Empty line
-            
-            # Basic info block
-            lines.append("📋 **Basic Information**")
-            lines.append(f"• **Genres:** {genres_text}")
-            lines.append(f"• **Status:** {status}")
-            
-            if media_type == "movie":
-                lines.append(f"• **Runtime:** {runtime_text}")
-                lines.append(f"• **Release Date:** {release_date}")
+                original_line = f"\n🎭 *Original Title:* {original_title}"
             else:
-                lines.append(f"• **Seasons:** {seasons_text} ({episodes_text})")
-                lines.append(f"• **First Air Date:** {release_date}")
-            
-            lines.append(f"• **Production:** {companies_text}")
-            lines.append(f"• **Languages:** {languages_text}")
-            
-            lines.append("")  # Empty line
-            
-            # Director/Creator
+                original_line = ""
+
+            tagline_line = f"\n💫 *\"{tagline}\"*" if tagline else ""
+
             if media_type == "movie":
-                lines.append(f"🎬 **Director:** {director_text}")
+                runtime_line = f"• **Runtime:** {runtime_text}"
+                date_line = f"• **Release Date:** {release_date}"
+                director_line = f"🎬 **Director:** {director_text}"
             else:
-                lines.append(f"📺 **Creator:** {director_text}")
-            
-            lines.append("")  # Empty line
-            
-            # Cast
-            lines.append("👥 **Top Cast:**")
-            lines.append(cast_text)
-            
-            lines.append("")  # Empty line
-            
-            # Overview
-            lines.append("📝 **Overview:**")
-            lines.append(overview)
-            
-            lines.append("")  # Empty line
-            
-            # External links
-            lines.append("🔗 **Links:**")
-            lines.append(f"• **TMDB:** {tmdb_url}")
+                runtime_line = f"• **Seasons:** {seasons_text} ({episodes_text})"
+                date_line = f"• **First Air Date:** {release_date}"
+                director_line = f"📺 **Creator:** {director_text}"
+
             if imdb_url:
-                lines.append(f"• **IMDb:** {imdb_url}")
-                lines.append(f"• **IMDb ID:** `{imdb_id}`")
-            
-            # YouTube trailers
+                imdb_block = f"\n• **IMDb:** {imdb_url}\n• **IMDb ID:** `{imdb_id}`"
+            else:
+                imdb_block = ""
+
             if youtube_trailers:
-                trailer = youtube_trailers[0]
-                youtube_url = f"https://www.youtube.com/watch?v={trailer.get('key')}"
-                lines.append(f"• **Trailer:** {youtube_url}")
-            
+                trailer_key = youtube_trailers[0].get("key")
+                trailer_line = f"\n• **Trailer:** https://www.youtube.com/watch?v={trailer_key}"
+            else:
+                trailer_line = ""
+
             # Additional information section
-            lines.append("")  # Empty line
-            lines.append("📊 **Additional Info**")
-            
+            extras = []
+
             # Budget and revenue (for movies)
             if media_type == "movie":
                 budget = media_data.get("budget", 0)
                 revenue = media_data.get("revenue", 0)
-                
+
                 if budget > 0:
-                    lines.append(f"• **Budget:** ${budget:,}")
+                    extras.append(f"\n• **Budget:** ${budget:,}")
                 if revenue > 0:
-                    lines.append(f"• **Revenue:** ${revenue:,}")
-            
+                    extras.append(f"\n• **Revenue:** ${revenue:,}")
+
             # Homepage (if available)
             homepage = media_data.get("homepage")
             if homepage:
-                lines.append(f"• **Homepage:** {homepage[:50]}{'...' if len(homepage) > 50 else ''}")
-            
+                extras.append(f"\n• **Homepage:** {homepage[:50]}{'...' if len(homepage) > 50 else ''}")
+
             # Content rating
             content_ratings = media_data.get("content_ratings", {}).get("results", [])
-            us_rating = next((r for r in content_ratings if r.get("iso_3166_1") == "US"), None)
+            ratings_by_country = {r.get("iso_3166_1"): r for r in content_ratings}
+            us_rating = ratings_by_country.get("US")
             if us_rating:
-                lines.append(f"• **US Rating:** {us_rating.get('rating', 'N/A')}")
-            
-            # Footer
-            lines.append("")  # Empty line
-            lines.append("─" * 40)
-            lines.append("💡 *Tip: Use the buttons below to request or search again*")
-            
-            formatted_text = "\n".join(lines)
-            
+                extras.append(f"\n• **US Rating:** {us_rating.get('rating', 'N/A')}")
+
+            formatted_text = _RICH_CARD_TMPL.format_map({
+                "title": title,
+                "year": year,
+                "original_line": original_line,
+                "tagline_line": tagline_line,
+                "rating_text": rating_text,
+                "rating_stars": rating_stars,
+                "genres_text": genres_text,
+                "status": status,
+                "runtime_line": runtime_line,
+                "date_line": date_line,
+                "companies_text": companies_text,
+                "languages_text": languages_text,
+                "director_line": director_line,
+                "cast_text": cast_text,
+                "overview": overview,
+                "tmdb_url": tmdb_url,
+                "imdb_block": imdb_block,
+                "trailer_line": trailer_line,
+                "extras_block": "".join(extras),
+            })
+
             return formatted_text, poster_url, backdrop_url
             
         except Exception as e:
@@ -555,24 +648,14 @@ class TMDBClient:
             return error_msg, None, None
     
     def _format_rating_stars(self, rating: float) -> str:
-        """Format rating as stars (★)"""
+        """Format rating as stars (★) via the precomputed table"""
         if rating <= 0:
-            return "☆☆☆☆☆"
-        
-        full_stars = int(rating / 2)  # Convert 10-point scale to 5-star scale
-        half_star = 1 if (rating / 2) - full_stars >= 0.5 else 0
-        empty_stars = 5 - full_stars - half_star
-        
-        stars = "★" * full_stars
-        if half_star:
-            stars += "½"
-        stars += "☆" * empty_stars
-        
-        return stars
+            return _STARS[0]
+        return _STARS[min(int(rating), 10)]
     
     def get_genres(self, media_type: str) -> List[Dict]:
         """Get genre list for movies or TV shows"""
-        if media_type not in ("movie", "tv"):
+        if media_type not in _MEDIA_TYPES:
             return []
         
         cache_key = f"tmdb_genres:{media_type}"
@@ -599,9 +682,9 @@ class TMDBClient:
     
     def get_trending(self, media_type: str = "all", time_window: str = "week") -> List[Dict]:
         """Get trending movies/TV shows"""
-        if media_type not in ("all", "movie", "tv"):
+        if media_type not in _TRENDING_MEDIA:
             media_type = "all"
-        if time_window not in ("day", "week"):
+        if time_window not in _TIME_WINDOWS:
             time_window = "week"
         
         cache_key = f"tmdb_trending:{media_type}:{time_window}"
@@ -616,7 +699,7 @@ class TMDBClient:
                 results = data["results"]
                 # Filter only movies/TV if media_type is "all"
                 if media_type == "all":
-                    results = [r for r in results if r.get("media_type") in ("movie", "tv")]
+                    results = [r for r in results if r.get("media_type") in _MEDIA_TYPES]
                 
                 Cache.set(cache_key, results, ttl=3600)  # 1 hour
                 return results
@@ -644,6 +727,44 @@ class TMDBClient:
         
         return []
     
+    # Async wrappers: the bot's pyrogram handlers run on the event loop,
+    # so these push the blocking HTTP call onto the default executor and
+    # let concurrent searches/detail fetches overlap instead of
+    # serializing the loop. The underlying client stays on a pooled
+    # keep-alive requests.Session shared with the synchronous call sites.
+    async def search_multi_async(self, query: str, page: int = 1) -> List[Dict]:
+        """Async wrapper for search_multi (runs in the default executor)"""
+        return await asyncio.to_thread(self.search_multi, query, page)
+
+    async def get_details_async(self, media_type: str, tmdb_id: int) -> Optional[Dict]:
+        """Async wrapper for get_details (runs in the default executor)"""
+        return await asyncio.to_thread(self.get_details, media_type, tmdb_id)
+
+    async def get_details_many(self, items: List[Tuple[str, int]]) -> List[Optional[Dict]]:
+        """
+        Coalesced detail fetch for several (media_type, tmdb_id) pairs.
+        Duplicates are folded and fetched once, distinct keys overlap in
+        the executor, so rendering a trending/similar page costs one
+        wall-clock round trip instead of N sequential ones (the token
+        bucket still paces the underlying requests).
+        """
+        unique = list(dict.fromkeys(items))
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self.get_details, media_type, tmdb_id)
+              for media_type, tmdb_id in unique))
+        by_key = dict(zip(unique, results))
+        return [by_key[key] for key in items]
+
+    async def get_trending_async(self, media_type: str = "all",
+                                 time_window: str = "week") -> List[Dict]:
+        """Async wrapper for get_trending (runs in the default executor)"""
+        return await asyncio.to_thread(self.get_trending, media_type, time_window)
+
+    async def get_similar_async(self, media_type: str, tmdb_id: int,
+                                limit: int = 5) -> List[Dict]:
+        """Async wrapper for get_similar (runs in the default executor)"""
+        return await asyncio.to_thread(self.get_similar, media_type, tmdb_id, limit)
+
     def format_duration(self, minutes: int) -> str:
         """Format duration in minutes to human readable format"""
         if not minutes:
@@ -679,8 +800,17 @@ def get_poster_url(poster_path: Optional[str]) -> Optional[str]:
     """Get full poster URL"""
     return tmdb_client.get_poster_url(poster_path)
 
+async def search_tmdb_async(query: str, page: int = 1) -> List[Dict]:
+    """Search TMDB without blocking the event loop"""
+    return await tmdb_client.search_multi_async(query, page)
+
+async def get_tmdb_details_async(media_type: str, tmdb_id: int) -> Optional[Dict]:
+    """Get detailed information from TMDB without blocking the event loop"""
+    return await tmdb_client.get_details_async(media_type, tmdb_id)
+
 # Export
 __all__ = [
     'tmdb_client', 'TMDBClient',
-    'search_tmdb', 'get_tmdb_details', 'build_detail_card', 'get_poster_url'
+    'search_tmdb', 'get_tmdb_details', 'build_detail_card', 'get_poster_url',
+    'search_tmdb_async', 'get_tmdb_details_async'
 ]